@@ -1,22 +1,44 @@
 """The Bluesky Feed integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from pathlib import Path
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .coordinator import BlueskyFeedCoordinator
+from .const import (
+    DOMAIN,
+    ENGAGEMENT_MAX_AGE,
+    MAX_POST_IMAGES,
+    SEARCH_DB_FILENAME,
+    SEARCH_MAX_POSTS_PER_ENTRY,
+    STARTUP_STAGGER,
+)
+from .coordinator import CACHE_VERSION, BlueskyFeedCoordinator
+from .search import SORT_RANK, SORT_RECENT, BlueskySearchIndex
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 SERVICE_LIKE_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): str,
@@ -47,6 +69,71 @@ SERVICE_UNREPOST_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): str,
+    }
+)
+
+SERVICE_TRENDING_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): str,
+        vol.Optional("limit", default=5): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=50)
+        ),
+        vol.Optional("window", default=60): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=ENGAGEMENT_MAX_AGE // 60)
+        ),
+    }
+)
+
+SERVICE_SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): str,
+        vol.Required("query"): str,
+        vol.Optional("author"): str,
+        vol.Optional("sort", default=SORT_RANK): vol.In(
+            [SORT_RANK, SORT_RECENT]
+        ),
+        vol.Optional("limit", default=20): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional("offset", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+    }
+)
+
+SERVICE_POST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required("entity_id"): str,
+            vol.Required("text"): str,
+            vol.Optional("reply_to"): str,
+            vol.Optional("quote"): str,
+            vol.Optional("images"): vol.All(
+                cv.ensure_list,
+                [
+                    vol.Any(
+                        vol.All(str, lambda path: {"path": path}),
+                        vol.Schema(
+                            {
+                                vol.Required("path"): str,
+                                vol.Optional("alt", default=""): str,
+                            }
+                        ),
+                    )
+                ],
+                vol.Length(max=MAX_POST_IMAGES),
+            ),
+            vol.Optional("video"): str,
+            vol.Optional("video_alt", default=""): str,
+            vol.Optional("langs"): vol.All(cv.ensure_list, [str]),
+        }
+    ),
+    cv.has_at_most_one_key("images", "video"),
+)
+
 
 def _get_coordinator(
     hass: HomeAssistant, entity_id: str
@@ -65,13 +152,174 @@ def _get_coordinator(
     return coordinator
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Bluesky Feed services and shared state.
+
+    Nothing here touches the network or disk, so it costs nothing on the
+    startup critical path even with many entries configured.
+    """
+    hass.data.setdefault(DOMAIN, {})
+
+    # The index opens its database on first use, in the executor
+    index = BlueskySearchIndex(
+        hass.config.path(".storage", SEARCH_DB_FILENAME),
+        SEARCH_MAX_POSTS_PER_ENTRY,
+    )
+    hass.data[DOMAIN]["search_index"] = index
+
+    async def _close_index(event: Event) -> None:
+        await hass.async_add_executor_job(index.close)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_index)
+
+    async def handle_like(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        uri = await coord.async_like_post(
+            call.data["uri"], call.data["cid"]
+        )
+        return {"record_uri": uri}
+
+    async def handle_unlike(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        await coord.async_unlike_post(call.data["record_uri"])
+
+    async def handle_repost(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        uri = await coord.async_repost_post(
+            call.data["uri"], call.data["cid"]
+        )
+        return {"record_uri": uri}
+
+    async def handle_unrepost(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        await coord.async_unrepost_post(call.data["record_uri"])
+
+    async def handle_refresh(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        await coord.async_request_fresh_refresh()
+
+    async def handle_trending(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        return {
+            "posts": coord.trending(
+                call.data["limit"], call.data["window"] * 60
+            )
+        }
+
+    async def handle_search(call: ServiceCall):
+        entry_id = None
+        if "entity_id" in call.data:
+            coord = _get_coordinator(hass, call.data["entity_id"])
+            entry_id = coord.config_entry.entry_id
+        index: BlueskySearchIndex = hass.data[DOMAIN]["search_index"]
+        try:
+            return await hass.async_add_executor_job(
+                index.search,
+                call.data["query"],
+                entry_id,
+                call.data.get("author"),
+                call.data["sort"],
+                call.data["limit"],
+                call.data["offset"],
+            )
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    async def handle_post(call: ServiceCall):
+        coord = _get_coordinator(hass, call.data["entity_id"])
+        images = call.data.get("images", [])
+        paths = [image["path"] for image in images]
+        if "video" in call.data:
+            paths.append(call.data["video"])
+        for path in paths:
+            if not hass.config.is_allowed_path(path):
+                raise HomeAssistantError(
+                    f"Cannot read {path}, no access to path; "
+                    "add it to allowlist_external_dirs"
+                )
+        try:
+            return await coord.async_create_post(
+                call.data["text"],
+                reply_to=call.data.get("reply_to"),
+                quote=call.data.get("quote"),
+                images=images,
+                video=call.data.get("video"),
+                video_alt=call.data["video_alt"],
+                langs=call.data.get("langs"),
+            )
+        except (OSError, ValueError) as err:
+            raise HomeAssistantError(f"Could not attach media: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN,
+        "like",
+        handle_like,
+        schema=SERVICE_LIKE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "unlike",
+        handle_unlike,
+        schema=SERVICE_UNLIKE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "repost",
+        handle_repost,
+        schema=SERVICE_REPOST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "unrepost",
+        handle_unrepost,
+        schema=SERVICE_UNREPOST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "post",
+        handle_post,
+        schema=SERVICE_POST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "refresh",
+        handle_refresh,
+        schema=SERVICE_REFRESH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "trending",
+        handle_trending,
+        schema=SERVICE_TRENDING_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "search",
+        handle_search,
+        schema=SERVICE_SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    return True
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> bool:
-    """Set up Bluesky Feed from a config entry."""
+    """Set up Bluesky Feed from a config entry.
+
+    Setup does not wait for the network: the sensor comes up with the
+    posts cached from the last run (or an initializing state) and the
+    first login and fetch run as a background task.
+    """
     hass.data.setdefault(DOMAIN, {})
+    started = time.monotonic()
 
-    # Register the frontend card static path (once)
+    # Register the frontend card static path (once, on first entry)
     if "frontend_loaded" not in hass.data[DOMAIN]:
         card_path = str(Path(__file__).parent / "www" / "bluesky-feed-card.js")
         card_url = "/bluesky_feed/bluesky-feed-card.js"
@@ -83,72 +331,60 @@ async def async_setup_entry(
         )
         hass.data[DOMAIN]["frontend_loaded"] = True
 
-    # Register services (once)
-    if "services_registered" not in hass.data[DOMAIN]:
-
-        async def handle_like(call: ServiceCall):
-            coord = _get_coordinator(hass, call.data["entity_id"])
-            uri = await coord.async_like_post(
-                call.data["uri"], call.data["cid"]
-            )
-            return {"record_uri": uri}
-
-        async def handle_unlike(call: ServiceCall):
-            coord = _get_coordinator(hass, call.data["entity_id"])
-            await coord.async_unlike_post(call.data["record_uri"])
-
-        async def handle_repost(call: ServiceCall):
-            coord = _get_coordinator(hass, call.data["entity_id"])
-            uri = await coord.async_repost_post(
-                call.data["uri"], call.data["cid"]
-            )
-            return {"record_uri": uri}
-
-        async def handle_unrepost(call: ServiceCall):
-            coord = _get_coordinator(hass, call.data["entity_id"])
-            await coord.async_unrepost_post(call.data["record_uri"])
-
-        hass.services.async_register(
-            DOMAIN,
-            "like",
-            handle_like,
-            schema=SERVICE_LIKE_SCHEMA,
-            supports_response=SupportsResponse.OPTIONAL,
-        )
-        hass.services.async_register(
-            DOMAIN,
-            "unlike",
-            handle_unlike,
-            schema=SERVICE_UNLIKE_SCHEMA,
-        )
-        hass.services.async_register(
-            DOMAIN,
-            "repost",
-            handle_repost,
-            schema=SERVICE_REPOST_SCHEMA,
-            supports_response=SupportsResponse.OPTIONAL,
-        )
-        hass.services.async_register(
-            DOMAIN,
-            "unrepost",
-            handle_unrepost,
-            schema=SERVICE_UNREPOST_SCHEMA,
-        )
-        hass.data[DOMAIN]["services_registered"] = True
-
     coordinator = BlueskyFeedCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_load_cache()
+    cache_loaded = time.monotonic()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms_ready = time.monotonic()
     entry.async_on_unload(
         entry.add_update_listener(_async_update_listener)
     )
 
+    # Stagger first refreshes while HA is starting so entries don't all
+    # log in and fetch at once
+    delay = 0.0
+    if not hass.is_running:
+        slot = hass.data[DOMAIN].get("startup_slot", 0)
+        hass.data[DOMAIN]["startup_slot"] = slot + 1
+        delay = slot * STARTUP_STAGGER
+
+    entry.async_create_background_task(
+        hass,
+        _async_first_refresh(coordinator, entry, delay),
+        f"{DOMAIN} first refresh {entry.entry_id}",
+    )
+
+    _LOGGER.debug(
+        "Setup of %s took %.3fs (cache %.3fs, platforms %.3fs); "
+        "first refresh in %.1fs",
+        entry.title,
+        platforms_ready - started,
+        cache_loaded - started,
+        platforms_ready - cache_loaded,
+        delay,
+    )
     return True
 
 
+async def _async_first_refresh(
+    coordinator: BlueskyFeedCoordinator, entry: ConfigEntry, delay: float
+) -> None:
+    """Run an entry's first login and fetch off the setup path."""
+    if delay:
+        await asyncio.sleep(delay)
+    started = time.monotonic()
+    await coordinator.async_refresh()
+    _LOGGER.debug(
+        "First refresh of %s took %.3fs (success: %s)",
+        entry.title,
+        time.monotonic() - started,
+        coordinator.last_update_success,
+    )
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> bool:
@@ -157,10 +393,23 @@ async def async_unload_entry(
         entry, PLATFORMS
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            coordinator.release_account()
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> None:
+    """Remove a config entry's cached and indexed posts."""
+    for key in (f"{DOMAIN}.{entry.entry_id}", f"{DOMAIN}.{entry.entry_id}.seen"):
+        await Store(hass, CACHE_VERSION, key).async_remove()
+    index = hass.data.get(DOMAIN, {}).get("search_index")
+    if index is not None:
+        await hass.async_add_executor_job(index.remove_entry, entry.entry_id)
+
+
 async def _async_update_listener(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
@@ -0,0 +1,72 @@
+"""Shared response cache for unauthenticated Bluesky Feed requests."""
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import urlencode
+
+from .singleflight import SingleFlight
+
+
+class ResponseCache:
+    """Short-lived cache of public API responses, shared by all entries.
+
+    Only unauthenticated responses belong here: they carry no viewer
+    state, so every entry asking for the same URL and parameters can be
+    served the same body. Misses for the same key share one request.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        """Initialize the cache. ttl is the longest any entry is kept."""
+        self._ttl = ttl
+        self._max_entries = max_entries
+        # key -> (time fetched, response)
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._flight = SingleFlight()
+
+    @staticmethod
+    def _key(url: str, params: dict[str, Any]) -> str:
+        """Build a cache key that ignores parameter order."""
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+        max_age: float | None = None,
+    ) -> Any:
+        """Return a cached response younger than max_age, or fetch it.
+
+        max_age defaults to the cache's ttl and cannot exceed it.
+        """
+        key = self._key(url, params)
+        hit = self._entries.get(key)
+        if max_age is None or max_age > self._ttl:
+            max_age = self._ttl
+        if hit is not None and time.monotonic() - hit[0] < max_age:
+            return hit[1]
+
+        async def _load() -> Any:
+            data = await fetch()
+            self._store(key, data)
+            return data
+
+        return await self._flight.run(key, _load)
+
+    def expire(self, url: str, params: dict[str, Any]) -> None:
+        """Drop a cached response so the next get fetches it again."""
+        self._entries.pop(self._key(url, params), None)
+
+    def _store(self, key: str, data: Any) -> None:
+        """Insert a response, dropping expired and then oldest entries."""
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (now, data)
+        cutoff = now - self._ttl
+        for stale in [k for k, (at, _) in self._entries.items() if at <= cutoff]:
+            del self._entries[stale]
+        overflow = len(self._entries) - self._max_entries
+        for oldest in list(self._entries)[: max(0, overflow)]:
+            del self._entries[oldest]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import aiohttp
@@ -10,6 +11,10 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import (
+    TextSelector,
+    TextSelectorConfig,
+)
 
 from .const import (
     DOMAIN,
@@ -21,12 +26,21 @@ from .const import (
     CONF_FEED_URI,
     CONF_POST_LIMIT,
     CONF_UPDATE_INTERVAL,
+    CONF_MUTED_WORDS,
+    CONF_MUTED_PATTERNS,
+    CONF_HIDE_REPOSTS,
+    CONF_HIDE_REPLIES,
+    CONF_LANGUAGES,
+    CONF_BLOCKED_AUTHORS,
+    CONF_LIKE_EVENTS,
+    CONF_REPOST_EVENTS,
     FEED_TYPE_TIMELINE,
     FEED_TYPE_AUTHOR,
     FEED_TYPE_CUSTOM,
     DEFAULT_POST_LIMIT,
     DEFAULT_UPDATE_INTERVAL,
 )
+from .filters import compile_patterns
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,21 +61,27 @@ class BlueskyFeedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            handle = user_input[CONF_HANDLE]
-            password = user_input[CONF_PASSWORD]
+            handle = user_input.get(CONF_HANDLE, "").strip()
+            password = user_input.get(CONF_PASSWORD, "")
 
-            if await self._validate_credentials(handle, password):
+            if not handle and not password:
+                # Public mode: only author and custom feeds, no login
+                return await self.async_step_feed_type()
+            if not handle or not password:
+                errors["base"] = "incomplete"
+            elif await self._validate_credentials(handle, password):
                 self._data[CONF_HANDLE] = handle
                 self._data[CONF_PASSWORD] = password
                 return await self.async_step_feed_type()
-            errors["base"] = "auth"
+            else:
+                errors["base"] = "auth"
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HANDLE): str,
-                    vol.Required(CONF_PASSWORD): str,
+                    vol.Optional(CONF_HANDLE, default=""): str,
+                    vol.Optional(CONF_PASSWORD, default=""): str,
                 }
             ),
             errors=errors,
@@ -81,18 +101,22 @@ class BlueskyFeedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return await self.async_step_settings()
 
+        feed_types = {
+            FEED_TYPE_AUTHOR: "Specific User's Posts",
+            FEED_TYPE_CUSTOM: "Custom Feed URL",
+        }
+        default = FEED_TYPE_AUTHOR
+        if CONF_HANDLE in self._data:
+            # The home timeline needs a logged-in account
+            feed_types = {FEED_TYPE_TIMELINE: "Following", **feed_types}
+            default = FEED_TYPE_TIMELINE
+
         return self.async_show_form(
             step_id="feed_type",
             data_schema=vol.Schema(
                 {
-                    vol.Required(
-                        CONF_FEED_TYPE, default=FEED_TYPE_TIMELINE
-                    ): vol.In(
-                        {
-                            FEED_TYPE_TIMELINE: "Following",
-                            FEED_TYPE_AUTHOR: "Specific User's Posts",
-                            FEED_TYPE_CUSTOM: "Custom Feed URL",
-                        }
+                    vol.Required(CONF_FEED_TYPE, default=default): vol.In(
+                        feed_types
                     ),
                 }
             ),
@@ -203,8 +227,22 @@ class BlueskyFeedOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            patterns = [
+                line.strip()
+                for line in user_input.get(CONF_MUTED_PATTERNS, "").splitlines()
+                if line.strip()
+            ]
+            try:
+                compile_patterns(patterns)
+            except re.error:
+                errors[CONF_MUTED_PATTERNS] = "invalid_regex"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = {**self.config_entry.options, **(user_input or {})}
 
         return self.async_show_form(
             step_id="init",
@@ -212,7 +250,7 @@ class BlueskyFeedOptionsFlow(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_POST_LIMIT,
-                        default=self.config_entry.options.get(
+                        default=options.get(
                             CONF_POST_LIMIT,
                             self.config_entry.data.get(
                                 CONF_POST_LIMIT, DEFAULT_POST_LIMIT
@@ -223,7 +261,7 @@ class BlueskyFeedOptionsFlow(config_entries.OptionsFlow):
                     ),
                     vol.Optional(
                         CONF_UPDATE_INTERVAL,
-                        default=self.config_entry.options.get(
+                        default=options.get(
                             CONF_UPDATE_INTERVAL,
                             self.config_entry.data.get(
                                 CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
@@ -232,6 +270,39 @@ class BlueskyFeedOptionsFlow(config_entries.OptionsFlow):
                     ): vol.All(
                         vol.Coerce(int), vol.Range(min=30, max=3600)
                     ),
+                    vol.Optional(
+                        CONF_HIDE_REPOSTS,
+                        default=options.get(CONF_HIDE_REPOSTS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_HIDE_REPLIES,
+                        default=options.get(CONF_HIDE_REPLIES, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MUTED_WORDS,
+                        default=options.get(CONF_MUTED_WORDS, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_MUTED_PATTERNS,
+                        default=options.get(CONF_MUTED_PATTERNS, ""),
+                    ): TextSelector(TextSelectorConfig(multiline=True)),
+                    vol.Optional(
+                        CONF_LANGUAGES,
+                        default=options.get(CONF_LANGUAGES, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_BLOCKED_AUTHORS,
+                        default=options.get(CONF_BLOCKED_AUTHORS, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_LIKE_EVENTS,
+                        default=options.get(CONF_LIKE_EVENTS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_REPOST_EVENTS,
+                        default=options.get(CONF_REPOST_EVENTS, False),
+                    ): bool,
                 }
             ),
+            errors=errors,
         )
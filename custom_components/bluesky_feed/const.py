@@ -12,6 +12,14 @@ CONF_AUTHOR_HANDLE = "author_handle"
 CONF_FEED_URI = "feed_uri"
 CONF_POST_LIMIT = "post_limit"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_MUTED_WORDS = "muted_words"
+CONF_MUTED_PATTERNS = "muted_patterns"
+CONF_HIDE_REPOSTS = "hide_reposts"
+CONF_HIDE_REPLIES = "hide_replies"
+CONF_LANGUAGES = "languages"
+CONF_BLOCKED_AUTHORS = "blocked_authors"
+CONF_LIKE_EVENTS = "like_events"
+CONF_REPOST_EVENTS = "repost_events"
 
 FEED_TYPE_TIMELINE = "timeline"
 FEED_TYPE_AUTHOR = "author"
@@ -19,3 +27,25 @@ FEED_TYPE_CUSTOM = "custom"
 
 DEFAULT_POST_LIMIT = 20
 DEFAULT_UPDATE_INTERVAL = 300
+
+STARTUP_STAGGER = 2
+PUBLIC_CACHE_TTL = 60
+PUBLIC_CACHE_MAX_ENTRIES = 256
+
+EVENT_NEW_POST = f"{DOMAIN}_new_post"
+EVENT_ENGAGEMENT = f"{DOMAIN}_engagement"
+SEEN_URIS_MAX = 1000
+
+MAX_POST_IMAGES = 4
+MAX_CONCURRENT_UPLOADS = 2
+UPLOAD_CHUNK_SIZE = 256 * 1024
+IMAGE_MAX_BYTES = 1_000_000
+IMAGE_MAX_DIMENSION = 2000
+VIDEO_MAX_BYTES = 100 * 1024 * 1024
+
+ENGAGEMENT_MAX_SAMPLES = 48
+ENGAGEMENT_MAX_POSTS = 500
+ENGAGEMENT_MAX_AGE = 6 * 3600
+
+SEARCH_DB_FILENAME = "bluesky_feed_search.db"
+SEARCH_MAX_POSTS_PER_ENTRY = 5000
@@ -1,14 +1,20 @@
 """DataUpdateCoordinator for Bluesky Feed."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -25,14 +31,47 @@ from .const import (
     CONF_FEED_URI,
     CONF_POST_LIMIT,
     CONF_UPDATE_INTERVAL,
+    CONF_LIKE_EVENTS,
+    CONF_REPOST_EVENTS,
+    EVENT_ENGAGEMENT,
+    EVENT_NEW_POST,
+    SEEN_URIS_MAX,
+    PUBLIC_CACHE_MAX_ENTRIES,
+    PUBLIC_CACHE_TTL,
+    ENGAGEMENT_MAX_AGE,
+    ENGAGEMENT_MAX_POSTS,
+    ENGAGEMENT_MAX_SAMPLES,
     FEED_TYPE_TIMELINE,
     FEED_TYPE_CUSTOM,
     DEFAULT_POST_LIMIT,
     DEFAULT_UPDATE_INTERVAL,
+    MAX_CONCURRENT_UPLOADS,
+    UPLOAD_CHUNK_SIZE,
 )
+from .cache import ResponseCache
+from .engagement import EngagementHistory
+from .filters import PostFilter
+from .media import PreparedMedia, prepare_image, prepare_video
+from .richtext import detect_facets, detect_mentions, mention_facet
+from .singleflight import SingleFlight
 
 _LOGGER = logging.getLogger(__name__)
 
+CACHE_VERSION = 1
+CACHE_SAVE_DELAY = 30
+
+
+class BlueskyAccount:
+    """Session tokens for one Bluesky login, shared by its config entries."""
+
+    def __init__(self, password: str) -> None:
+        """Initialize the account."""
+        self.password = password
+        self.access_jwt: str | None = None
+        self.refresh_jwt: str | None = None
+        self.did: str | None = None
+        self.flight = SingleFlight()
+
 
 class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     """Coordinator to fetch and cache Bluesky feed data."""
@@ -41,18 +80,45 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
-        self._handle = entry.data[CONF_HANDLE]
-        self._password = entry.data[CONF_PASSWORD]
+        self._handle = entry.data.get(CONF_HANDLE, "")
+        self._password = entry.data.get(CONF_PASSWORD, "")
         self._feed_type = entry.data.get(CONF_FEED_TYPE, FEED_TYPE_TIMELINE)
         self._author_handle = entry.data.get(CONF_AUTHOR_HANDLE, "")
         self._feed_uri = entry.data.get(CONF_FEED_URI, "")
-        self._access_jwt: str | None = None
-        self._refresh_jwt: str | None = None
-        self._did: str | None = None
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        # Without credentials only public author and custom feeds work
+        self._account: BlueskyAccount | None = None
+        if self._handle and self._password:
+            accounts = domain_data.setdefault("accounts", {})
+            account = accounts.get(self._handle.lower())
+            if account is None or account.password != self._password:
+                account = BlueskyAccount(self._password)
+                accounts[self._handle.lower()] = account
+            self._account = account
+        self._public_cache: ResponseCache = domain_data.setdefault(
+            "public_cache",
+            ResponseCache(PUBLIC_CACHE_TTL, PUBLIC_CACHE_MAX_ENTRIES),
+        )
+        self._skip_public_cache = False
         self._post_limit = entry.options.get(
             CONF_POST_LIMIT,
             entry.data.get(CONF_POST_LIMIT, DEFAULT_POST_LIMIT),
         )
+        self._filter = PostFilter.from_options(entry.options)
+        self._cache: Store[list[dict[str, Any]]] = Store(
+            hass, CACHE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.from_cache = False
+        # Insertion-ordered so the oldest keys are evicted first
+        self._seen: dict[str, None] = {}
+        self._seen_store: Store[list[str]] = Store(
+            hass, CACHE_VERSION, f"{DOMAIN}.{entry.entry_id}.seen"
+        )
+        self.engagement = EngagementHistory(
+            ENGAGEMENT_MAX_SAMPLES, ENGAGEMENT_MAX_POSTS, ENGAGEMENT_MAX_AGE
+        )
+        self._like_events = entry.options.get(CONF_LIKE_EVENTS, False)
+        self._repost_events = entry.options.get(CONF_REPOST_EVENTS, False)
 
         update_interval = entry.options.get(
             CONF_UPDATE_INTERVAL,
@@ -66,8 +132,134 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             update_interval=timedelta(seconds=update_interval),
         )
 
+    async def async_load_cache(self) -> None:
+        """Seed data with the posts published on the previous run."""
+        cached = await self._cache.async_load()
+        if cached is not None:
+            # Filters may have changed since the cache was written
+            self.data = self._filter.apply(cached)
+            self.from_cache = True
+        seen = await self._seen_store.async_load()
+        if seen is not None:
+            self._seen = dict.fromkeys(seen)
+
+    def release_account(self) -> None:
+        """Forget the shared session once no other loaded entry uses it."""
+        if self._account is None:
+            return
+        domain_data = self.hass.data.get(DOMAIN, {})
+        if any(
+            isinstance(other, BlueskyFeedCoordinator)
+            and other is not self
+            and other._account is self._account
+            for other in domain_data.values()
+        ):
+            return
+        accounts = domain_data.get("accounts", {})
+        if accounts.get(self._handle.lower()) is self._account:
+            del accounts[self._handle.lower()]
+
+    async def async_request_fresh_refresh(self) -> None:
+        """Request a refresh that bypasses the shared public cache."""
+        self._skip_public_cache = True
+        await self.async_request_refresh()
+
+    @staticmethod
+    def _seen_key(post: dict[str, Any]) -> str:
+        """Return the key identifying a feed item for new-post events.
+
+        A repost is a new feed item even if the original was already seen.
+        It is keyed on the reposter's DID, which survives renames.
+        """
+        if post.get("is_repost"):
+            return f"{post['uri']}|{post.get('reposted_by_did', '')}"
+        return post["uri"]
+
+    def _fire_events(self, posts: list[dict[str, Any]]) -> None:
+        """Fire events for new posts and, optionally, engagement gains."""
+        entry_id = self.config_entry.entry_id
+        first_run = not self._seen
+
+        new_keys = [
+            key
+            for key in map(self._seen_key, posts)
+            if key not in self._seen
+        ]
+        if new_keys:
+            for key in new_keys:
+                self._seen[key] = None
+            overflow = len(self._seen) - SEEN_URIS_MAX
+            for key in list(self._seen)[: max(0, overflow)]:
+                del self._seen[key]
+            self._seen_store.async_delay_save(
+                lambda: list(self._seen), CACHE_SAVE_DELAY
+            )
+
+        # Seed silently on a fresh install instead of announcing the
+        # whole feed as new
+        if not first_run:
+            new = set(new_keys)
+            # Feeds are newest-first; fire oldest-first
+            for post in reversed(posts):
+                if self._seen_key(post) in new:
+                    self.hass.bus.async_fire(
+                        EVENT_NEW_POST, {"config_entry_id": entry_id, **post}
+                    )
+
+        if not (self._like_events or self._repost_events) or not self.data:
+            return
+        previous = {post["uri"]: post for post in self.data}
+        for post in posts:
+            old = previous.get(post["uri"])
+            if old is None:
+                continue
+            for kind, field, enabled in (
+                ("like", "like_count", self._like_events),
+                ("repost", "repost_count", self._repost_events),
+            ):
+                before = old.get(field, 0)
+                after = post.get(field, 0)
+                if enabled and after > before:
+                    self.hass.bus.async_fire(
+                        EVENT_ENGAGEMENT,
+                        {
+                            "config_entry_id": entry_id,
+                            "type": kind,
+                            "uri": post["uri"],
+                            "cid": post["cid"],
+                            "author_handle": post["author_handle"],
+                            "text": post["text"],
+                            "previous": before,
+                            "count": after,
+                            "delta": after - before,
+                        },
+                    )
+
+    def trending(self, limit: int, window: float) -> list[dict[str, Any]]:
+        """Return the current posts gaining engagement fastest."""
+        return self.engagement.trending(
+            self.data or [], limit, window, time.time()
+        )
+
+    async def _ensure_session(self) -> None:
+        """Log in if needed. Raises if the entry has no credentials."""
+        if self._account is None:
+            raise HomeAssistantError(
+                "This feed was set up without Bluesky credentials; "
+                "add an account to use this action"
+            )
+        if not self._account.access_jwt:
+            await self._create_session()
+
     async def _create_session(self) -> None:
-        """Create an authenticated session with Bluesky."""
+        """Create an authenticated session with Bluesky.
+
+        Concurrent logins for the same account share one request.
+        """
+        await self._account.flight.run("createSession", self._do_create_session)
+
+    async def _do_create_session(self) -> None:
+        """Log in and store the tokens on the shared account."""
         url = f"{PDSHOST}/xrpc/com.atproto.server.createSession"
         payload = {"identifier": self._handle, "password": self._password}
 
@@ -75,30 +267,43 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             async with session.post(url, json=payload) as resp:
                 if resp.status == 200:
                     data = await resp.json()
-                    self._access_jwt = data["accessJwt"]
-                    self._refresh_jwt = data["refreshJwt"]
-                    self._did = data["did"]
+                    self._account.access_jwt = data["accessJwt"]
+                    self._account.refresh_jwt = data["refreshJwt"]
+                    self._account.did = data["did"]
                 else:
                     text = await resp.text()
                     raise UpdateFailed(
                         f"Authentication failed ({resp.status}): {text}"
                     )
 
-    async def _refresh_session(self) -> None:
-        """Refresh the access token."""
-        if not self._refresh_jwt:
+    async def _refresh_session(self, stale_jwt: str | None = None) -> None:
+        """Refresh the access token.
+
+        stale_jwt is the token the caller saw rejected. If another caller
+        has replaced it in the meantime there is nothing to do; concurrent
+        refreshes for the same account share one request.
+        """
+        if stale_jwt is not None and self._account.access_jwt != stale_jwt:
+            return
+        await self._account.flight.run(
+            "refreshSession", self._do_refresh_session
+        )
+
+    async def _do_refresh_session(self) -> None:
+        """Swap the refresh token for new tokens, or log in again."""
+        if not self._account.refresh_jwt:
             await self._create_session()
             return
 
         url = f"{PDSHOST}/xrpc/com.atproto.server.refreshSession"
-        headers = {"Authorization": f"Bearer {self._refresh_jwt}"}
+        headers = {"Authorization": f"Bearer {self._account.refresh_jwt}"}
 
         async with aiohttp.ClientSession() as session:
             async with session.post(url, headers=headers) as resp:
                 if resp.status == 200:
                     data = await resp.json()
-                    self._access_jwt = data["accessJwt"]
-                    self._refresh_jwt = data["refreshJwt"]
+                    self._account.access_jwt = data["accessJwt"]
+                    self._account.refresh_jwt = data["refreshJwt"]
                 else:
                     await self._create_session()
 
@@ -120,14 +325,17 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     ) -> dict:
         """Make an authenticated GET request with automatic token refresh."""
         headers = {}
-        if auth and self._access_jwt:
-            headers["Authorization"] = f"Bearer {self._access_jwt}"
+        token = self._account.access_jwt if self._account else None
+        if auth and token:
+            headers["Authorization"] = f"Bearer {token}"
 
         async with aiohttp.ClientSession() as session:
             async with session.get(url, headers=headers, params=params) as resp:
                 if auth and await self._is_token_expired(resp):
-                    await self._refresh_session()
-                    headers["Authorization"] = f"Bearer {self._access_jwt}"
+                    await self._refresh_session(token)
+                    headers["Authorization"] = (
+                        f"Bearer {self._account.access_jwt}"
+                    )
                     async with session.get(
                         url, headers=headers, params=params
                     ) as retry:
@@ -150,16 +358,19 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     ) -> dict:
         """Make an authenticated POST request with automatic token refresh."""
         headers = {"Content-Type": "application/json"}
-        if auth and self._access_jwt:
-            headers["Authorization"] = f"Bearer {self._access_jwt}"
+        token = self._account.access_jwt
+        if auth and token:
+            headers["Authorization"] = f"Bearer {token}"
 
         async with aiohttp.ClientSession() as session:
             async with session.post(
                 url, headers=headers, json=payload
             ) as resp:
                 if auth and await self._is_token_expired(resp):
-                    await self._refresh_session()
-                    headers["Authorization"] = f"Bearer {self._access_jwt}"
+                    await self._refresh_session(token)
+                    headers["Authorization"] = (
+                        f"Bearer {self._account.access_jwt}"
+                    )
                     async with session.post(
                         url, headers=headers, json=payload
                     ) as retry:
@@ -177,75 +388,164 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                         f"API POST failed ({resp.status}): {text}"
                     )
 
+    @property
+    def _feed_key(self) -> str:
+        """Key identifying this entry's feed request within its account."""
+        if self._feed_type == FEED_TYPE_CUSTOM and self._feed_uri:
+            source = f"custom:{self._feed_uri}"
+        elif self._feed_type == FEED_TYPE_TIMELINE:
+            source = "timeline"
+        else:
+            source = f"author:{self._author_handle or self._handle}"
+        return f"feed:{source}:{self._post_limit}"
+
+    async def _fetch_feed(self) -> dict:
+        """Fetch the configured feed."""
+        if self._feed_type == FEED_TYPE_CUSTOM and self._feed_uri:
+            return await self._fetch_custom_feed()
+        if self._feed_type == FEED_TYPE_TIMELINE:
+            return await self._fetch_timeline()
+        return await self._fetch_author_feed()
+
     async def _fetch_timeline(self) -> dict:
         """Fetch the authenticated user's home timeline."""
         url = f"{PDSHOST}/xrpc/app.bsky.feed.getTimeline"
         return await self._api_get(url, {"limit": self._post_limit})
 
+    async def _fetch_public(self, url: str, params: dict) -> dict:
+        """GET a public endpoint, authenticated when the entry can be.
+
+        Logged-in requests carry viewer state (likes, reposts) and are
+        never shared. Anonymous requests go through the shared response
+        cache, so entries watching the same feed cause one fetch.
+        """
+        if self._account is not None:
+            return await self._api_get(url, params, auth=True)
+        if self._skip_public_cache:
+            # An explicit refresh asked for the feed as it is now
+            self._skip_public_cache = False
+            self._public_cache.expire(url, params)
+        # Half the poll interval, so a poll never gets back the response
+        # its own previous poll stored
+        return await self._public_cache.get(
+            url,
+            params,
+            lambda: self._api_get(url, params, auth=False),
+            max_age=self.update_interval.total_seconds() / 2,
+        )
+
     async def _fetch_author_feed(self) -> dict:
         """Fetch a specific author's feed."""
         actor = self._author_handle or self._handle
         url = f"{PUBLIC_API_HOST}/xrpc/app.bsky.feed.getAuthorFeed"
-        return await self._api_get(
+        return await self._fetch_public(
             url,
             {
                 "actor": actor,
                 "limit": self._post_limit,
                 "filter": "posts_and_author_threads",
             },
-            auth=True,
         )
 
     async def _fetch_custom_feed(self) -> dict:
         """Fetch a custom feed by its AT URI."""
         url = f"{PUBLIC_API_HOST}/xrpc/app.bsky.feed.getFeed"
-        return await self._api_get(
+        return await self._fetch_public(
             url,
             {
                 "feed": self._feed_uri,
                 "limit": self._post_limit,
             },
-            auth=True,
         )
 
     @staticmethod
-    def _parse_images(embed: dict) -> list[dict[str, str]]:
+    def _parse_aspect_ratio(view: dict) -> dict[str, int]:
+        """Extract a media view's aspect ratio, zero when unknown."""
+        ratio = view.get("aspectRatio") or {}
+        return {
+            "width": ratio.get("width", 0),
+            "height": ratio.get("height", 0),
+        }
+
+    @classmethod
+    def _parse_image(cls, img: dict) -> dict[str, Any]:
+        """Extract one image view, with its aspect ratio when known."""
+        return {
+            "thumb": img.get("thumb", ""),
+            "fullsize": img.get("fullsize", ""),
+            "alt": img.get("alt", ""),
+            **cls._parse_aspect_ratio(img),
+        }
+
+    @classmethod
+    def _parse_images(cls, embed: dict) -> list[dict[str, Any]]:
         """Extract images from a post embed."""
-        images = []
         if not embed:
-            return images
+            return []
 
         embed_type = embed.get("$type", "")
         if "images" in embed_type:
-            for img in embed.get("images", []):
-                images.append(
-                    {
-                        "thumb": img.get("thumb", ""),
-                        "fullsize": img.get("fullsize", ""),
-                        "alt": img.get("alt", ""),
-                    }
-                )
-        elif "recordWithMedia" in embed_type:
+            return [cls._parse_image(img) for img in embed.get("images", [])]
+        if "recordWithMedia" in embed_type:
             media = embed.get("media", {})
             if "images" in media.get("$type", ""):
-                for img in media.get("images", []):
-                    images.append(
-                        {
-                            "thumb": img.get("thumb", ""),
-                            "fullsize": img.get("fullsize", ""),
-                            "alt": img.get("alt", ""),
-                        }
-                    )
-        return images
+                return [
+                    cls._parse_image(img) for img in media.get("images", [])
+                ]
+        return []
 
     @staticmethod
-    def _parse_external(embed: dict) -> dict | None:
+    def _is_gif(ext: dict) -> bool:
+        """Return True for the Tenor GIF links Bluesky's GIF picker posts."""
+        url = urlparse(ext.get("uri", ""))
+        return url.hostname == "media.tenor.com" and url.path.endswith(".gif")
+
+    @classmethod
+    def _parse_video(cls, embed: dict) -> dict | None:
+        """Extract a video or GIF from a post embed."""
+        if not embed:
+            return None
+        embed_type = embed.get("$type", "")
+        if "recordWithMedia" in embed_type:
+            embed = embed.get("media", {})
+            embed_type = embed.get("$type", "")
+
+        if "video" in embed_type:
+            return {
+                "type": "video",
+                "playlist": embed.get("playlist", ""),
+                "thumbnail": embed.get("thumbnail", ""),
+                "alt": embed.get("alt", ""),
+                **cls._parse_aspect_ratio(embed),
+            }
+        if "external" in embed_type:
+            ext = embed.get("external", {})
+            if not cls._is_gif(ext):
+                return None
+            # Tenor links carry the GIF's dimensions as ww/hh query params
+            query = parse_qs(urlparse(ext["uri"]).query)
+            width = query.get("ww", [""])[0]
+            height = query.get("hh", [""])[0]
+            return {
+                "type": "gif",
+                "playlist": ext["uri"],
+                "thumbnail": ext.get("thumb", ""),
+                "alt": ext.get("description") or ext.get("title", ""),
+                "width": int(width) if width.isdigit() else 0,
+                "height": int(height) if height.isdigit() else 0,
+            }
+        return None
+
+    @classmethod
+    def _parse_external(cls, embed: dict) -> dict | None:
         """Extract external link preview from a post embed."""
         if not embed:
             return None
         embed_type = embed.get("$type", "")
         if "external" in embed_type:
             ext = embed.get("external", {})
+            if cls._is_gif(ext):
+                return None
             return {
                 "uri": ext.get("uri", ""),
                 "title": ext.get("title", ""),
@@ -295,11 +595,13 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                 == "app.bsky.feed.defs#reasonRepost"
             )
             reposted_by = ""
+            reposted_by_did = ""
             if is_repost:
                 by = reason.get("by", {})
                 reposted_by = (
                     by.get("displayName") or by.get("handle", "")
                 )
+                reposted_by_did = by.get("did", "")
 
             reply = item.get("reply", {})
             reply_parent = reply.get("parent", {})
@@ -315,10 +617,12 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                     "author_avatar": author.get("avatar", ""),
                     "text": record.get("text", ""),
                     "facets": record.get("facets", []),
+                    "langs": record.get("langs", []),
                     "created_at": record.get("createdAt", ""),
                     "indexed_at": post.get("indexedAt", ""),
                     "images": self._parse_images(embed),
                     "external": self._parse_external(embed),
+                    "video": self._parse_video(embed),
                     "quote": self._parse_quote(embed),
                     "like_count": post.get("likeCount", 0),
                     "repost_count": post.get("repostCount", 0),
@@ -331,6 +635,7 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                     ),
                     "is_repost": is_repost,
                     "reposted_by": reposted_by,
+                    "reposted_by_did": reposted_by_did,
                     "is_reply": bool(reply_parent_author.get("handle")),
                     "reply_to_handle": reply_parent_author.get(
                         "handle", ""
@@ -345,12 +650,11 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
 
     async def async_like_post(self, uri: str, cid: str) -> str:
         """Like a post. Returns the record URI of the like."""
-        if not self._access_jwt:
-            await self._create_session()
+        await self._ensure_session()
 
         url = f"{PDSHOST}/xrpc/com.atproto.repo.createRecord"
         payload = {
-            "repo": self._did,
+            "repo": self._account.did,
             "collection": "app.bsky.feed.like",
             "record": {
                 "$type": "app.bsky.feed.like",
@@ -363,13 +667,12 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
 
     async def async_unlike_post(self, record_uri: str) -> None:
         """Remove a like by its record URI."""
-        if not self._access_jwt:
-            await self._create_session()
+        await self._ensure_session()
 
         rkey = record_uri.rsplit("/", 1)[-1]
         url = f"{PDSHOST}/xrpc/com.atproto.repo.deleteRecord"
         payload = {
-            "repo": self._did,
+            "repo": self._account.did,
             "collection": "app.bsky.feed.like",
             "rkey": rkey,
         }
@@ -377,12 +680,11 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
 
     async def async_repost_post(self, uri: str, cid: str) -> str:
         """Repost a post. Returns the record URI of the repost."""
-        if not self._access_jwt:
-            await self._create_session()
+        await self._ensure_session()
 
         url = f"{PDSHOST}/xrpc/com.atproto.repo.createRecord"
         payload = {
-            "repo": self._did,
+            "repo": self._account.did,
             "collection": "app.bsky.feed.repost",
             "record": {
                 "$type": "app.bsky.feed.repost",
@@ -395,34 +697,224 @@ class BlueskyFeedCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
 
     async def async_unrepost_post(self, record_uri: str) -> None:
         """Remove a repost by its record URI."""
-        if not self._access_jwt:
-            await self._create_session()
+        await self._ensure_session()
 
         rkey = record_uri.rsplit("/", 1)[-1]
         url = f"{PDSHOST}/xrpc/com.atproto.repo.deleteRecord"
         payload = {
-            "repo": self._did,
+            "repo": self._account.did,
             "collection": "app.bsky.feed.repost",
             "rkey": rkey,
         }
         await self._api_post(url, payload)
 
+    async def _stream_file(self, path: str) -> AsyncIterator[bytes]:
+        """Yield a file in chunks, reading each chunk in the executor."""
+        handle = await self.hass.async_add_executor_job(open, path, "rb")
+        try:
+            while chunk := await self.hass.async_add_executor_job(
+                handle.read, UPLOAD_CHUNK_SIZE
+            ):
+                yield chunk
+        finally:
+            await self.hass.async_add_executor_job(handle.close)
+
+    async def _upload_blob(self, media: PreparedMedia) -> dict:
+        """Stream a prepared file to uploadBlob. Returns the blob ref."""
+        url = f"{PDSHOST}/xrpc/com.atproto.repo.uploadBlob"
+
+        token = self._account.access_jwt
+
+        def _post(session: aiohttp.ClientSession):
+            headers = {
+                "Authorization": f"Bearer {self._account.access_jwt}",
+                "Content-Type": media.mime_type,
+                "Content-Length": str(media.size),
+            }
+            return session.post(
+                url, headers=headers, data=self._stream_file(media.path)
+            )
+
+        async with aiohttp.ClientSession() as session:
+            async with _post(session) as resp:
+                if await self._is_token_expired(resp):
+                    await self._refresh_session(token)
+                    async with _post(session) as retry:
+                        if retry.status == 200:
+                            return (await retry.json())["blob"]
+                        text = await retry.text()
+                        raise UpdateFailed(
+                            f"Blob upload failed ({retry.status}): {text}"
+                        )
+                if resp.status == 200:
+                    return (await resp.json())["blob"]
+                text = await resp.text()
+                raise UpdateFailed(
+                    f"Blob upload failed ({resp.status}): {text}"
+                )
+
+    async def _get_post_ref(self, uri: str) -> dict[str, Any]:
+        """Look up a post's strong ref and record by its AT URI."""
+        url = f"{PDSHOST}/xrpc/app.bsky.feed.getPosts"
+        data = await self._api_get(url, {"uris": uri})
+        posts = data.get("posts", [])
+        if not posts:
+            raise UpdateFailed(f"Post not found: {uri}")
+        return posts[0]
+
+    async def _build_facets(self, text: str) -> list[dict[str, Any]]:
+        """Detect links, tags and mentions, resolving mentioned handles."""
+        facets = detect_facets(text)
+        url = f"{PDSHOST}/xrpc/com.atproto.identity.resolveHandle"
+        for handle, index in detect_mentions(text):
+            try:
+                data = await self._api_get(url, {"handle": handle})
+            except UpdateFailed:
+                # Unknown handles stay plain text, as in the official app
+                continue
+            facets.append(mention_facet(data["did"], index))
+        return sorted(facets, key=lambda f: f["index"]["byteStart"])
+
+    async def async_create_post(
+        self,
+        text: str,
+        reply_to: str | None = None,
+        quote: str | None = None,
+        images: list[dict[str, str]] | None = None,
+        video: str | None = None,
+        video_alt: str = "",
+        langs: list[str] | None = None,
+    ) -> dict[str, str]:
+        """Create a post. Returns the uri and cid of the new record.
+
+        Images are resized and stripped of metadata in the executor and
+        uploaded concurrently (bounded by MAX_CONCURRENT_UPLOADS); all
+        media is streamed from disk rather than read into memory.
+        """
+        await self._ensure_session()
+
+        record: dict[str, Any] = {
+            "$type": "app.bsky.feed.post",
+            "text": text,
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+        }
+        if langs:
+            record["langs"] = langs
+        facets = await self._build_facets(text)
+        if facets:
+            record["facets"] = facets
+
+        if reply_to:
+            parent = await self._get_post_ref(reply_to)
+            parent_ref = {"uri": parent["uri"], "cid": parent["cid"]}
+            root_ref = (
+                parent.get("record", {}).get("reply", {}).get("root")
+                or parent_ref
+            )
+            record["reply"] = {"root": root_ref, "parent": parent_ref}
+
+        media_embed: dict[str, Any] | None = None
+        if images:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+            async def _process(image: dict[str, str]) -> dict[str, Any]:
+                async with semaphore:
+                    media = await self.hass.async_add_executor_job(
+                        prepare_image, image["path"]
+                    )
+                    try:
+                        blob = await self._upload_blob(media)
+                    finally:
+                        await self.hass.async_add_executor_job(media.cleanup)
+                entry: dict[str, Any] = {
+                    "image": blob,
+                    "alt": image.get("alt", ""),
+                }
+                if media.width and media.height:
+                    entry["aspectRatio"] = {
+                        "width": media.width,
+                        "height": media.height,
+                    }
+                return entry
+
+            media_embed = {
+                "$type": "app.bsky.embed.images",
+                "images": await asyncio.gather(
+                    *(_process(image) for image in images)
+                ),
+            }
+        elif video:
+            media = await self.hass.async_add_executor_job(
+                prepare_video, video
+            )
+            media_embed = {
+                "$type": "app.bsky.embed.video",
+                "video": await self._upload_blob(media),
+            }
+            if video_alt:
+                media_embed["alt"] = video_alt
+
+        if quote:
+            quoted = await self._get_post_ref(quote)
+            quote_embed = {
+                "$type": "app.bsky.embed.record",
+                "record": {"uri": quoted["uri"], "cid": quoted["cid"]},
+            }
+            if media_embed:
+                record["embed"] = {
+                    "$type": "app.bsky.embed.recordWithMedia",
+                    "record": quote_embed,
+                    "media": media_embed,
+                }
+            else:
+                record["embed"] = quote_embed
+        elif media_embed:
+            record["embed"] = media_embed
+
+        url = f"{PDSHOST}/xrpc/com.atproto.repo.createRecord"
+        payload = {
+            "repo": self._account.did,
+            "collection": "app.bsky.feed.post",
+            "record": record,
+        }
+        result = await self._api_post(url, payload)
+        return {"uri": result.get("uri", ""), "cid": result.get("cid", "")}
+
     async def _async_update_data(self) -> list[dict[str, Any]]:
         """Fetch feed data from Bluesky."""
-        if not self._access_jwt:
+        if self._account is not None and not self._account.access_jwt:
             await self._create_session()
 
         try:
-            if self._feed_type == FEED_TYPE_CUSTOM and self._feed_uri:
-                data = await self._fetch_custom_feed()
-            elif self._feed_type == FEED_TYPE_TIMELINE:
-                data = await self._fetch_timeline()
+            if self._account is None:
+                data = await self._fetch_feed()
             else:
-                data = await self._fetch_author_feed()
-            return self._parse_feed(data)
+                data = await self._account.flight.run(
+                    self._feed_key, self._fetch_feed
+                )
+            posts = self._filter.apply(self._parse_feed(data))
         except UpdateFailed:
             raise
         except Exception as err:
             raise UpdateFailed(
                 f"Error fetching Bluesky feed: {err}"
             ) from err
+
+        await self._async_index_posts(posts)
+        self._fire_events(posts)
+        self.engagement.record(posts, time.time())
+        self.from_cache = False
+        self._cache.async_delay_save(lambda: posts, CACHE_SAVE_DELAY)
+        return posts
+
+    async def _async_index_posts(self, posts: list[dict[str, Any]]) -> None:
+        """Add fetched posts to the shared search index."""
+        index = self.hass.data.get(DOMAIN, {}).get("search_index")
+        if index is None:
+            return
+        try:
+            await self.hass.async_add_executor_job(
+                index.add_posts, self.config_entry.entry_id, posts
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Error updating Bluesky search index")
@@ -0,0 +1,121 @@
+"""Engagement history and trending computation for Bluesky Feed."""
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+# Each sample is (timestamp, likes, reposts, replies), stored flat
+_FIELDS = 4
+
+
+def engagement_score(likes: float, reposts: float, replies: float) -> float:
+    """Weight a post's counters into a single engagement number."""
+    return likes + 2 * reposts + replies
+
+
+class EngagementHistory:
+    """Bounded per-post counter history, one flat float array per post.
+
+    Only the counters are sampled, never the post itself, so memory is
+    max_posts * max_samples * 32 bytes at most. Samples are kept at least
+    max_age / (max_samples - 2) apart, with the newest one overwritten
+    in place until it is due, so the history spans max_age whatever the
+    poll interval. Posts that drop out of the feed are evicted once their
+    last sample is older than max_age.
+    """
+
+    def __init__(
+        self, max_samples: int, max_posts: int, max_age: float
+    ) -> None:
+        """Initialize the history."""
+        self._max_len = max_samples * _FIELDS
+        # One slot is the moving newest sample, the rest span max_age
+        self._spacing = max_age / (max_samples - 2)
+        self._max_posts = max_posts
+        self._max_age = max_age
+        self._series: dict[str, array] = {}
+
+    def record(self, posts: list[dict[str, Any]], now: float) -> None:
+        """Append a sample for every post and evict stale series."""
+        for post in posts:
+            uri = post.get("uri")
+            if not uri:
+                continue
+            series = self._series.pop(uri, None)
+            if series is None:
+                series = array("d")
+            elif (
+                len(series) >= 2 * _FIELDS
+                and series[-_FIELDS] - series[-2 * _FIELDS] < self._spacing
+            ):
+                # The newest sample is too close to the one before it to
+                # keep; the new sample replaces it
+                del series[-_FIELDS:]
+            series.extend(
+                (
+                    now,
+                    post.get("like_count", 0),
+                    post.get("repost_count", 0),
+                    post.get("reply_count", 0),
+                )
+            )
+            if len(series) > self._max_len:
+                del series[: len(series) - self._max_len]
+            # Re-insert so dict order tracks recency for eviction
+            self._series[uri] = series
+
+        cutoff = now - self._max_age
+        for uri in [u for u, s in self._series.items() if s[-_FIELDS] < cutoff]:
+            del self._series[uri]
+        overflow = len(self._series) - self._max_posts
+        for uri in list(self._series)[: max(0, overflow)]:
+            del self._series[uri]
+
+    def velocity(
+        self, uri: str, window: float, now: float
+    ) -> tuple[float, float]:
+        """Return (score gain, gain per hour) over the trailing window."""
+        series = self._series.get(uri)
+        if series is None or len(series) < 2 * _FIELDS:
+            return 0.0, 0.0
+
+        # Oldest sample still inside the window, else the oldest we have
+        start = 0
+        for offset in range(0, len(series), _FIELDS):
+            if series[offset] >= now - window:
+                start = offset
+                break
+        end = len(series) - _FIELDS
+        if start == end:
+            start = max(0, end - _FIELDS)
+
+        elapsed = series[end] - series[start]
+        if elapsed <= 0:
+            return 0.0, 0.0
+        gain = engagement_score(
+            *series[end + 1 : end + _FIELDS]
+        ) - engagement_score(*series[start + 1 : start + _FIELDS])
+        return gain, gain * 3600 / elapsed
+
+    def trending(
+        self,
+        posts: list[dict[str, Any]],
+        limit: int,
+        window: float,
+        now: float,
+    ) -> list[dict[str, Any]]:
+        """Return the fastest-rising of the given posts, fastest first."""
+        ranked = []
+        for post in posts:
+            gain, per_hour = self.velocity(post.get("uri", ""), window, now)
+            if gain > 0:
+                ranked.append((per_hour, gain, post))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {
+                **post,
+                "engagement_gain": gain,
+                "engagement_per_hour": round(per_hour, 2),
+            }
+            for per_hour, gain, post in ranked[:limit]
+        ]
@@ -0,0 +1,126 @@
+"""Server-side content filtering for Bluesky Feed posts."""
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    CONF_BLOCKED_AUTHORS,
+    CONF_HIDE_REPLIES,
+    CONF_HIDE_REPOSTS,
+    CONF_LANGUAGES,
+    CONF_MUTED_PATTERNS,
+    CONF_MUTED_WORDS,
+)
+
+
+def split_list(value: str) -> list[str]:
+    """Split a comma- or newline-separated option into clean items."""
+    return [item.strip() for item in re.split(r"[,\n]", value or "") if item.strip()]
+
+
+def compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile regexes into a single alternation. Raises re.error."""
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE
+    )
+
+
+class PostFilter:
+    """Compiled filter applied to parsed posts before they are published.
+
+    Muted words are folded into one word-boundary regex so each post's
+    text is scanned once regardless of how many words are muted.
+    """
+
+    def __init__(
+        self,
+        muted_words: list[str],
+        muted_patterns: list[str],
+        hide_reposts: bool,
+        hide_replies: bool,
+        languages: list[str],
+        blocked_authors: list[str],
+    ) -> None:
+        """Initialize the filter."""
+        self._hide_reposts = hide_reposts
+        self._hide_replies = hide_replies
+        self._languages = {lang.lower() for lang in languages}
+        self._blocked_authors = {
+            author.lstrip("@").lower() for author in blocked_authors
+        }
+
+        words = sorted({word.lower() for word in muted_words}, key=len, reverse=True)
+        self._words_re = (
+            re.compile(
+                r"(?<!\w)(?:" + "|".join(map(re.escape, words)) + r")(?!\w)",
+                re.IGNORECASE,
+            )
+            if words
+            else None
+        )
+        self._patterns_re = compile_patterns(muted_patterns)
+
+        self.active = bool(
+            hide_reposts
+            or hide_replies
+            or self._languages
+            or self._blocked_authors
+            or self._words_re
+            or self._patterns_re
+        )
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> PostFilter:
+        """Build a filter from config entry options."""
+        return cls(
+            muted_words=split_list(options.get(CONF_MUTED_WORDS, "")),
+            muted_patterns=[
+                line.strip()
+                for line in options.get(CONF_MUTED_PATTERNS, "").splitlines()
+                if line.strip()
+            ],
+            hide_reposts=options.get(CONF_HIDE_REPOSTS, False),
+            hide_replies=options.get(CONF_HIDE_REPLIES, False),
+            languages=split_list(options.get(CONF_LANGUAGES, "")),
+            blocked_authors=split_list(options.get(CONF_BLOCKED_AUTHORS, "")),
+        )
+
+    def _is_hidden(self, post: dict[str, Any]) -> bool:
+        """Return True if a post should be dropped."""
+        if self._hide_reposts and post.get("is_repost"):
+            return True
+        if self._hide_replies and post.get("is_reply"):
+            return True
+        if self._blocked_authors and (
+            post.get("author_handle", "").lower() in self._blocked_authors
+            or post.get("author_did", "").lower() in self._blocked_authors
+        ):
+            return True
+        if self._languages:
+            langs = post.get("langs") or []
+            if langs and not any(
+                lang.lower().split("-", 1)[0] in self._languages
+                or lang.lower() in self._languages
+                for lang in langs
+            ):
+                return True
+        if self._words_re or self._patterns_re:
+            text = post.get("text", "")
+            quote = post.get("quote")
+            if quote:
+                text = f"{text}\n{quote.get('text', '')}"
+            if self._words_re and self._words_re.search(text):
+                return True
+            if self._patterns_re and self._patterns_re.search(text):
+                return True
+        return False
+
+    def apply(self, posts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the posts that pass the filter."""
+        if not self.active:
+            return posts
+        return [post for post in posts if not self._is_hidden(post)]
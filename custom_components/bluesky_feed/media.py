@@ -0,0 +1,137 @@
+"""Local media preparation for posts created by Bluesky Feed.
+
+Everything in this module blocks and must run in an executor.
+"""
+from __future__ import annotations
+
+import logging
+import mimetypes
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .const import IMAGE_MAX_BYTES, IMAGE_MAX_DIMENSION, VIDEO_MAX_BYTES
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+_LOGGER = logging.getLogger(__name__)
+
+_JPEG_QUALITIES = (90, 82, 74, 66, 58, 50)
+
+
+@dataclass
+class PreparedMedia:
+    """A file ready to be streamed to uploadBlob."""
+
+    path: str
+    mime_type: str
+    size: int
+    width: int | None = None
+    height: int | None = None
+    temporary: bool = False
+
+    def cleanup(self) -> None:
+        """Delete the file if it was created during preparation."""
+        if self.temporary:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+def prepare_image(path: str) -> PreparedMedia:
+    """Strip metadata and shrink an image to Bluesky's blob limits.
+
+    The re-encoded image is written to a temporary file so the upload can
+    stream it from disk. Without Pillow the original file is uploaded
+    as-is, which only works if it is already small enough.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        _LOGGER.warning(
+            "Pillow is not installed; uploading %s without resizing or "
+            "removing metadata",
+            path,
+        )
+        return _prepare_unprocessed(path, IMAGE_MAX_BYTES)
+
+    with Image.open(path) as img:
+        # exif_transpose returns a copy without format, so read it first
+        source_format = img.format
+        # Apply the EXIF orientation before the metadata is dropped
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION))
+        keep_png = source_format == "PNG" or _has_alpha(img)
+        if not keep_png:
+            img = _to_rgb(img)
+
+        fd, out_path = tempfile.mkstemp(suffix=".png" if keep_png else ".jpg")
+        os.close(fd)
+        try:
+            # A fresh save without exif=/pnginfo= writes no metadata
+            if keep_png:
+                img.save(out_path, "PNG", optimize=True)
+            if not keep_png or os.path.getsize(out_path) > IMAGE_MAX_BYTES:
+                keep_png = False
+                img = _to_rgb(img)
+                for quality in _JPEG_QUALITIES:
+                    img.save(out_path, "JPEG", quality=quality, optimize=True)
+                    if os.path.getsize(out_path) <= IMAGE_MAX_BYTES:
+                        break
+            size = os.path.getsize(out_path)
+            if size > IMAGE_MAX_BYTES:
+                raise ValueError(
+                    f"{path} is still {size} bytes after compression "
+                    f"(limit {IMAGE_MAX_BYTES})"
+                )
+        except BaseException:
+            os.unlink(out_path)
+            raise
+
+        return PreparedMedia(
+            path=out_path,
+            mime_type="image/png" if keep_png else "image/jpeg",
+            size=size,
+            width=img.width,
+            height=img.height,
+            temporary=True,
+        )
+
+
+def _has_alpha(img: Image) -> bool:
+    """Return True if the image has an alpha band or a transparent color."""
+    return "A" in img.getbands() or "transparency" in img.info
+
+
+def _to_rgb(img: Image) -> Image:
+    """Convert to RGB for JPEG, flattening transparency onto white."""
+    from PIL import Image as PILImage
+
+    if img.mode == "RGB":
+        return img
+    if not _has_alpha(img):
+        return img.convert("RGB")
+    img = img.convert("RGBA")
+    flat = PILImage.new("RGB", img.size, (255, 255, 255))
+    flat.paste(img, mask=img.getchannel("A"))
+    return flat
+
+
+def prepare_video(path: str) -> PreparedMedia:
+    """Check a video file is uploadable. Videos are sent unmodified."""
+    media = _prepare_unprocessed(path, VIDEO_MAX_BYTES)
+    if not media.mime_type.startswith("video/"):
+        raise ValueError(f"{path} is not a video file")
+    return media
+
+
+def _prepare_unprocessed(path: str, max_bytes: int) -> PreparedMedia:
+    """Describe a file that will be uploaded unchanged."""
+    size = os.path.getsize(path)
+    if size > max_bytes:
+        raise ValueError(f"{path} is {size} bytes (limit {max_bytes})")
+    mime_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return PreparedMedia(path=path, mime_type=mime_type, size=size)
@@ -0,0 +1,95 @@
+"""Rich text facet detection for posts created by Bluesky Feed."""
+from __future__ import annotations
+
+import re
+from typing import Any
+
+# Patterns follow the reference implementation in @atproto/api's RichText
+_MENTION_RE = re.compile(r"(^|\s|\()(@)([a-zA-Z0-9.-]+)(\b)")
+_LINK_RE = re.compile(r"(^|\s|\()(https?://[^\s]+)", re.IGNORECASE)
+_TAG_RE = re.compile(
+    r"(^|\s)[#\uFF03]([^\s\u00AD\u2060\u200A\u200B\u200C\u200D\u20e2]+)"
+)
+_TRAILING_PUNCTUATION = ".,;:!?\"'"
+_HANDLE_RE = re.compile(
+    r"^([a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+"
+    r"[a-zA-Z]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$"
+)
+
+
+def _byte_index(text: str, start: int, end: int) -> dict[str, int]:
+    """Convert a str slice to the UTF-8 byte range facets are indexed by."""
+    byte_start = len(text[:start].encode("utf-8"))
+    return {
+        "byteStart": byte_start,
+        "byteEnd": byte_start + len(text[start:end].encode("utf-8")),
+    }
+
+
+def _strip_link(url: str) -> str:
+    """Drop trailing punctuation and an unbalanced closing paren."""
+    url = url.rstrip(_TRAILING_PUNCTUATION)
+    if url.endswith(")") and "(" not in url:
+        url = url[:-1]
+    return url
+
+
+def detect_mentions(text: str) -> list[tuple[str, dict[str, int]]]:
+    """Return (handle, byte index) for every @handle in the text."""
+    mentions = []
+    for match in _MENTION_RE.finditer(text):
+        handle = match.group(3).rstrip(".")
+        if not _HANDLE_RE.match(handle):
+            continue
+        start = match.start(2)
+        mentions.append(
+            (handle.lower(), _byte_index(text, start, start + 1 + len(handle)))
+        )
+    return mentions
+
+
+def detect_facets(text: str) -> list[dict[str, Any]]:
+    """Return link and hashtag facets for the text.
+
+    Mentions need a handle-to-DID lookup, so they are returned separately
+    by detect_mentions and resolved by the caller.
+    """
+    facets: list[dict[str, Any]] = []
+
+    for match in _LINK_RE.finditer(text):
+        url = _strip_link(match.group(2))
+        start = match.start(2)
+        facets.append(
+            {
+                "index": _byte_index(text, start, start + len(url)),
+                "features": [
+                    {"$type": "app.bsky.richtext.facet#link", "uri": url}
+                ],
+            }
+        )
+
+    for match in _TAG_RE.finditer(text):
+        tag = match.group(2).rstrip(_TRAILING_PUNCTUATION)
+        if not tag or tag.isdigit() or len(tag) > 64:
+            continue
+        start = match.start(2) - 1
+        facets.append(
+            {
+                "index": _byte_index(text, start, start + 1 + len(tag)),
+                "features": [
+                    {"$type": "app.bsky.richtext.facet#tag", "tag": tag}
+                ],
+            }
+        )
+
+    return facets
+
+
+def mention_facet(did: str, index: dict[str, int]) -> dict[str, Any]:
+    """Build a mention facet for a resolved DID."""
+    return {
+        "index": index,
+        "features": [
+            {"$type": "app.bsky.richtext.facet#mention", "did": did}
+        ],
+    }
@@ -0,0 +1,225 @@
+"""Local full-text search index for Bluesky Feed posts."""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from typing import Any
+
+SORT_RANK = "rank"
+SORT_RECENT = "recent"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    uri TEXT NOT NULL UNIQUE,
+    author_did TEXT NOT NULL DEFAULT '',
+    author_handle TEXT NOT NULL DEFAULT '',
+    author_name TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS post_entries (
+    entry_id TEXT NOT NULL,
+    uri TEXT NOT NULL,
+    seen_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+    PRIMARY KEY (entry_id, uri)
+);
+CREATE INDEX IF NOT EXISTS post_entries_uri ON post_entries(uri);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    text, author_name, author_handle,
+    content='posts', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS posts_ai AFTER INSERT ON posts BEGIN
+    INSERT INTO posts_fts(rowid, text, author_name, author_handle)
+    VALUES (new.id, new.text, new.author_name, new.author_handle);
+END;
+CREATE TRIGGER IF NOT EXISTS posts_ad AFTER DELETE ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, text, author_name, author_handle)
+    VALUES ('delete', old.id, old.text, old.author_name, old.author_handle);
+END;
+CREATE TRIGGER IF NOT EXISTS posts_au AFTER UPDATE ON posts BEGIN
+    INSERT INTO posts_fts(posts_fts, rowid, text, author_name, author_handle)
+    VALUES ('delete', old.id, old.text, old.author_name, old.author_handle);
+    INSERT INTO posts_fts(rowid, text, author_name, author_handle)
+    VALUES (new.id, new.text, new.author_name, new.author_handle);
+END;
+"""
+
+
+def _build_match(query: str) -> str:
+    """Turn free text into an FTS5 expression matching every term.
+
+    Each term is quoted so punctuation in user input (hyphens, colons,
+    quotes) is never parsed as FTS5 syntax. A trailing ``*`` on a term is
+    kept as a prefix match.
+    """
+    terms = []
+    for term in query.split():
+        prefix = term.endswith("*")
+        term = term.rstrip("*")
+        if not term:
+            continue
+        quoted = '"' + term.replace('"', '""') + '"'
+        terms.append(quoted + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class BlueskySearchIndex:
+    """SQLite FTS5 index over the posts ingested by every coordinator.
+
+    Posts are stored once per URI and linked to the config entries that
+    have seen them, so the index keeps posts after they scroll out of the
+    live feed window. All methods block and must run in an executor.
+    """
+
+    def __init__(self, path: str, max_posts_per_entry: int) -> None:
+        """Initialize the index."""
+        self._path = path
+        self._max_posts_per_entry = max_posts_per_entry
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def add_posts(self, entry_id: str, posts: list[dict[str, Any]]) -> None:
+        """Insert or refresh posts for a config entry and prune old ones."""
+        if not posts:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO posts (
+                        uri, author_did, author_handle, author_name,
+                        text, created_at, data
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(uri) DO UPDATE SET
+                        author_handle = excluded.author_handle,
+                        author_name = excluded.author_name,
+                        text = excluded.text,
+                        data = excluded.data
+                    """,
+                    [
+                        (
+                            post["uri"],
+                            post.get("author_did", ""),
+                            post.get("author_handle", ""),
+                            post.get("author_name", ""),
+                            post.get("text", ""),
+                            post.get("created_at", ""),
+                            json.dumps(post),
+                        )
+                        for post in posts
+                        if post.get("uri")
+                    ],
+                )
+                conn.executemany(
+                    "INSERT INTO post_entries (entry_id, uri) VALUES (?, ?) "
+                    "ON CONFLICT(entry_id, uri) DO UPDATE SET "
+                    "seen_at = excluded.seen_at",
+                    [(entry_id, post["uri"]) for post in posts if post.get("uri")],
+                )
+                conn.execute(
+                    """
+                    DELETE FROM post_entries
+                    WHERE entry_id = ? AND uri NOT IN (
+                        SELECT uri FROM post_entries WHERE entry_id = ?
+                        ORDER BY seen_at DESC LIMIT ?
+                    )
+                    """,
+                    (entry_id, entry_id, self._max_posts_per_entry),
+                )
+                self._delete_orphans(conn)
+
+    def remove_entry(self, entry_id: str) -> None:
+        """Drop every post that only the given config entry had seen."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM post_entries WHERE entry_id = ?", (entry_id,)
+                )
+                self._delete_orphans(conn)
+
+    @staticmethod
+    def _delete_orphans(conn: sqlite3.Connection) -> None:
+        """Delete posts no longer linked to any config entry."""
+        conn.execute(
+            """
+            DELETE FROM posts WHERE NOT EXISTS (
+                SELECT 1 FROM post_entries WHERE post_entries.uri = posts.uri
+            )
+            """
+        )
+
+    def search(
+        self,
+        query: str,
+        entry_id: str | None = None,
+        author: str | None = None,
+        sort: str = SORT_RANK,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Search indexed posts. Returns the requested page and total hits."""
+        match = _build_match(query)
+        if not match:
+            return {"posts": [], "total": 0}
+
+        where = ["posts_fts MATCH ?"]
+        params: list[Any] = [match]
+        if entry_id:
+            where.append(
+                "EXISTS (SELECT 1 FROM post_entries pe "
+                "WHERE pe.uri = p.uri AND pe.entry_id = ?)"
+            )
+            params.append(entry_id)
+        if author:
+            handle = author.lstrip("@")
+            where.append("(p.author_handle = ? COLLATE NOCASE OR p.author_did = ?)")
+            params.extend([handle, handle])
+
+        base = (
+            "FROM posts_fts JOIN posts p ON p.id = posts_fts.rowid "
+            "WHERE " + " AND ".join(where)
+        )
+        order = (
+            "p.created_at DESC"
+            if sort == SORT_RECENT
+            else "bm25(posts_fts, 10.0, 2.0, 2.0), p.created_at DESC"
+        )
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                total = conn.execute(
+                    f"SELECT COUNT(*) {base}", params
+                ).fetchone()[0]
+                rows = conn.execute(
+                    f"SELECT p.data {base} ORDER BY {order} LIMIT ? OFFSET ?",
+                    [*params, limit, offset],
+                ).fetchall()
+            except sqlite3.OperationalError as err:
+                raise ValueError(f"Invalid search query: {err}") from err
+
+        return {
+            "posts": [json.loads(row[0]) for row in rows],
+            "total": total,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -62,11 +62,27 @@ class BlueskyFeedSensor(
         self._entry = entry
 
     @property
-    def native_value(self) -> int:
+    def available(self) -> bool:
+        """Stay available while there are posts to show, even stale ones."""
+        return self.coordinator.data is not None or super().available
+
+    @property
+    def native_value(self) -> int | None:
         """Return the number of posts in the feed."""
-        if self.coordinator.data:
-            return len(self.coordinator.data)
-        return 0
+        if self.coordinator.data is None:
+            return None
+        return len(self.coordinator.data)
+
+    @property
+    def _status(self) -> str:
+        """Return whether the posts are live, cached, stale or not loaded."""
+        if self.coordinator.data is None:
+            return "initializing"
+        if not self.coordinator.last_update_success:
+            return "stale"
+        if self.coordinator.from_cache:
+            return "cached"
+        return "ok"
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -74,4 +90,5 @@ class BlueskyFeedSensor(
         return {
             "posts": self.coordinator.data or [],
             "feed_type": self._entry.data.get(CONF_FEED_TYPE, "timeline"),
+            "status": self._status,
         }
@@ -0,0 +1,34 @@
+"""Request coalescing for Bluesky Feed."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers with the same key.
+
+    The first caller for a key starts the call; anyone else asking for the
+    same key before it finishes awaits the same task and gets the same
+    result or exception. The call is shielded, so one caller being
+    cancelled does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func for key, or join the call already running for it."""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
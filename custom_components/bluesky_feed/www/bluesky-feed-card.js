@@ -14,6 +14,8 @@ const ICON_LIKE = `<svg xmlns="http://www.w3.org/2000/svg" width="15" height="15
 
 const ICON_REPOST_SMALL = `<svg xmlns="http://www.w3.org/2000/svg" width="13" height="13" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="17 1 21 5 17 9"/><path d="M3 11V9a4 4 0 0 1 4-4h14"/><polyline points="7 23 3 19 7 15"/><path d="M21 13v2a4 4 0 0 1-4 4H3"/></svg>`;
 
+const ICON_PLAY = `<svg xmlns="http://www.w3.org/2000/svg" width="22" height="22" viewBox="0 0 24 24" fill="currentColor"><polygon points="6 3 20 12 6 21 6 3"/></svg>`;
+
 const ICON_REPLY_INDICATOR = `<svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" viewBox="0 0 24 24" fill="none"><path fill="currentColor" fill-rule="evenodd" clip-rule="evenodd" d="M15.793 10.293a1 1 0 0 1 1.338-.068l.076.068 3.293 3.293a2 2 0 0 1 .138 2.677l-.138.151-3.293 3.293a1 1 0 1 1-1.414-1.414L18.086 16H8a5 5 0 0 1-5-5V5a1 1 0 0 1 2 0v6a3 3 0 0 0 3 3h10.086l-2.293-2.293-.068-.076a1 1 0 0 1 .068-1.338Z"/></svg>`;
 
 // ---------------------------------------------------------------------------
@@ -26,9 +28,8 @@ function escapeHtml(text) {
   return el.innerHTML;
 }
 
-function timeAgo(isoString) {
+function timeAgo(isoString, now = Date.now()) {
   if (!isoString) return '';
-  const now = Date.now();
   const then = new Date(isoString).getTime();
   const diff = Math.max(0, now - then);
   const seconds = Math.floor(diff / 1000);
@@ -44,6 +45,37 @@ function timeAgo(isoString) {
   return `${months[d.getMonth()]} ${d.getDate()}`;
 }
 
+// One clock drives the relative timestamps of every card on the page. It
+// only rewrites timestamp text that actually changed, and stops while the
+// page is hidden.
+const CLOCK_INTERVAL_MS = 15000;
+const clockCards = new Set();
+let clockTimer = null;
+
+function tickClock() {
+  const now = Date.now();
+  for (const card of clockCards) card._refreshTimestamps(now);
+}
+
+function startClock() {
+  if (clockTimer || clockCards.size === 0 || document.hidden) return;
+  clockTimer = setInterval(tickClock, CLOCK_INTERVAL_MS);
+}
+
+function stopClock() {
+  clearInterval(clockTimer);
+  clockTimer = null;
+}
+
+document.addEventListener('visibilitychange', () => {
+  if (document.hidden) {
+    stopClock();
+  } else {
+    tickClock();
+    startClock();
+  }
+});
+
 function formatCount(n) {
   if (n == null || n === 0) return '0';
   if (n >= 1000000) return (n / 1000000).toFixed(1).replace(/\.0$/, '') + 'M';
@@ -115,6 +147,42 @@ function renderTextWithFacets(text, facets) {
   return result;
 }
 
+function connectionSaysSaveData() {
+  const conn = navigator.connection;
+  if (!conn) return false;
+  return !!conn.saveData || /(^|-)2g$/.test(conn.effectiveType || '');
+}
+
+function loadImage(img) {
+  if (!img.dataset.src) return;
+  img.src = img.dataset.src;
+  img.removeAttribute('data-src');
+}
+
+function aspectStyle(img) {
+  if (!img.width || !img.height) return '';
+  return ` style="aspect-ratio:${Number(img.width)} / ${Number(img.height)}"`;
+}
+
+// Browsers without native HLS (everything but Safari) get hls.js, fetched
+// the first time any card actually plays a video
+const HLS_JS_URL = 'https://cdn.jsdelivr.net/npm/hls.js@1.5.20/dist/hls.mjs';
+let hlsModule = null;
+// Set once the import has failed, so the page stops retrying it
+let hlsFailed = false;
+
+function loadHls() {
+  if (!hlsModule) {
+    hlsModule = import(HLS_JS_URL)
+      .then((mod) => mod.default)
+      .catch((err) => {
+        hlsFailed = true;
+        throw err;
+      });
+  }
+  return hlsModule;
+}
+
 function defaultAvatar(name) {
   const letter = ([...(name || '?')][0] || '?').toUpperCase();
   try {
@@ -283,12 +351,19 @@ const CARD_STYLES = `
 
   /* --- Images --- */
   .post-images {
+    position: relative;
     display: grid;
     gap: 4px;
     margin-top: 10px;
     border-radius: 10px;
     overflow: hidden;
   }
+  .post-images.count-2 {
+    aspect-ratio: 2 / 1;
+  }
+  .post-images.count-3, .post-images.count-4 {
+    aspect-ratio: 3 / 2;
+  }
   .post-images.count-1 {
     grid-template-columns: 1fr;
   }
@@ -319,6 +394,56 @@ const CARD_STYLES = `
   .post-image:hover {
     opacity: 0.9;
   }
+  .post-video {
+    position: relative;
+    margin-top: 10px;
+    border-radius: 10px;
+    overflow: hidden;
+    aspect-ratio: 16 / 9;
+    max-height: 360px;
+    background: #000;
+  }
+  .video-poster, .post-video video {
+    display: block;
+    width: 100%;
+    height: 100%;
+    object-fit: contain;
+  }
+  .video-play {
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    transform: translate(-50%, -50%);
+    width: 52px;
+    height: 52px;
+    border: none;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    background: rgba(0,0,0,.6);
+    color: #fff;
+    cursor: pointer;
+  }
+  .video-play:hover {
+    background: var(--bsky-blue);
+  }
+  .media-load {
+    position: absolute;
+    inset: 0;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    border: none;
+    background: transparent;
+    color: var(--secondary-text-color, #65676b);
+    font: inherit;
+    font-size: 13px;
+    cursor: pointer;
+  }
+  .media-load:hover {
+    color: var(--bsky-blue);
+  }
 
   /* --- External link card --- */
   .external-card {
@@ -544,6 +669,23 @@ const EDITOR_SCHEMA = [
     name: 'show_metrics',
     selector: { boolean: {} },
   },
+  {
+    name: 'autoplay_videos',
+    selector: { boolean: {} },
+  },
+  {
+    name: 'data_saver',
+    selector: {
+      select: {
+        options: [
+          { value: 'off', label: 'Off' },
+          { value: 'auto', label: 'When the browser asks to save data' },
+          { value: 'on', label: 'Always' },
+        ],
+        mode: 'dropdown',
+      },
+    },
+  },
   {
     name: 'repost_action',
     selector: {
@@ -594,6 +736,8 @@ class BlueskyFeedCardEditor extends HTMLElement {
           show_images: 'Show images',
           show_metrics: 'Show engagement metrics',
           repost_action: 'Repost button action',
+          autoplay_videos: 'Play videos muted when scrolled into view',
+          data_saver: 'Data saver (load media on tap)',
         };
         return labels[schema.name] || schema.name;
       };
@@ -622,6 +766,8 @@ class BlueskyFeedCardEditor extends HTMLElement {
       show_images: this._config.show_images !== false,
       show_metrics: this._config.show_metrics !== false,
       repost_action: this._config.repost_action ?? 'repost',
+      autoplay_videos: this._config.autoplay_videos ?? false,
+      data_saver: this._config.data_saver ?? 'off',
     };
   }
 
@@ -659,6 +805,8 @@ class BlueskyFeedCard extends HTMLElement {
       show_metrics: true,
       max_height: '600px',
       repost_action: 'repost',
+      autoplay_videos: false,
+      data_saver: 'off',
     };
   }
 
@@ -669,8 +817,41 @@ class BlueskyFeedCard extends HTMLElement {
     this._hass = null;
     this._lastUpdated = null;
     this._posts = [];
+    this._status = 'ok';
     this._lightboxHandler = null;
     this._interactionState = new Map();
+    this._mediaObserver = null;
+    this._videoObserver = null;
+    this._hlsPlayers = new Map();
+    this._dataSaver = false;
+    this._timestamps = [];
+  }
+
+  connectedCallback() {
+    const feed = this.shadowRoot.getElementById('feed');
+    if (feed) this._observeMedia(feed);
+    this._refreshTimestamps(Date.now());
+    clockCards.add(this);
+    startClock();
+  }
+
+  disconnectedCallback() {
+    if (this._mediaObserver) {
+      this._mediaObserver.disconnect();
+      this._mediaObserver = null;
+    }
+    if (this._videoObserver) {
+      this._videoObserver.disconnect();
+      this._videoObserver = null;
+    }
+    this._destroyVideos();
+    // Detached players lost their streams; render posters again next time
+    this._lastUpdated = null;
+    this.shadowRoot.querySelectorAll('.post-video[data-attached]').forEach((el) => {
+      delete el.dataset.attached;
+    });
+    clockCards.delete(this);
+    if (clockCards.size === 0) stopClock();
   }
 
   setConfig(config) {
@@ -686,6 +867,8 @@ class BlueskyFeedCard extends HTMLElement {
       show_metrics: config.show_metrics !== false,
       max_height: config.max_height ?? '600px',
       repost_action: config.repost_action ?? 'repost',
+      autoplay_videos: config.autoplay_videos === true,
+      data_saver: config.data_saver ?? 'off',
     };
     this._buildStructure();
   }
@@ -705,6 +888,7 @@ class BlueskyFeedCard extends HTMLElement {
     if (updated !== this._lastUpdated) {
       this._lastUpdated = updated;
       this._posts = entity.attributes.posts || [];
+      this._status = entity.attributes.status || 'ok';
       // Prune interaction state entries that the server has caught up with
       for (const [uri, state] of this._interactionState) {
         const serverPost = this._posts.find((p) => p.uri === uri);
@@ -726,6 +910,7 @@ class BlueskyFeedCard extends HTMLElement {
     const icon = this._config.icon;
     const title = this._config.title;
     const showHeader = icon || title;
+    this._timestamps = [];
     this.shadowRoot.innerHTML = `
       <style>${CARD_STYLES}</style>
       <ha-card>
@@ -744,6 +929,7 @@ class BlueskyFeedCard extends HTMLElement {
   _renderError(message) {
     const feed = this.shadowRoot.getElementById('feed');
     if (!feed) return;
+    this._timestamps = [];
     feed.innerHTML = `
       <div class="error-state">
         <div class="error-state-text">${escapeHtml(message)}</div>
@@ -756,25 +942,155 @@ class BlueskyFeedCard extends HTMLElement {
     if (!feed) return;
 
     const posts = this._posts.slice(0, this._config.max_posts);
+    const mode = this._config.data_saver;
+    this._dataSaver = mode === 'on' || (mode === 'auto' && connectionSaysSaveData());
+
+    // Videos already playing survive a re-render (a like count changing
+    // elsewhere in the feed) as long as their post is still listed
+    const attached = new Map();
+    feed.querySelectorAll('.post-video[data-attached]').forEach((el) => {
+      const uri = el.closest('.post')?.dataset.postUri;
+      if (uri) attached.set(uri, el);
+    });
 
     if (posts.length === 0) {
+      this._destroyVideos();
+      this._timestamps = [];
       feed.innerHTML = `
         <div class="empty-state">
           <ha-icon icon="${escapeHtml(this._config.icon)}" style="--mdc-icon-size:48px; color:var(--bsky-blue);"></ha-icon>
-          <div class="empty-state-text">No posts yet</div>
+          <div class="empty-state-text">${this._status === 'initializing' ? 'Loading posts…' : 'No posts yet'}</div>
         </div>
       `;
       return;
     }
 
     feed.innerHTML = posts.map((p) => this._renderPost(p)).join('');
+    // Moving the old node back in within the same task keeps it playing
+    feed.querySelectorAll('.post-video').forEach((el) => {
+      const uri = el.closest('.post').dataset.postUri;
+      const kept = attached.get(uri);
+      if (!kept) return;
+      el.replaceWith(kept);
+      attached.delete(uri);
+    });
+    this._destroyVideos([...attached.values()]);
+    this._timestamps = Array.from(feed.querySelectorAll('.timestamp[data-created-at]'));
     this._attachEventListeners(feed);
+    this._observeMedia(feed);
+  }
+
+  _refreshTimestamps(now) {
+    // Called by the shared clock; touches only labels whose bucket moved
+    for (const el of this._timestamps) {
+      const label = timeAgo(el.dataset.createdAt, now);
+      if (el.textContent !== label) el.textContent = label;
+    }
+  }
+
+  _observeMedia(feed) {
+    // Media is written with data-src and only fetched once it nears the
+    // viewport; data-saver placeholders wait for a tap instead
+    if (this._mediaObserver) this._mediaObserver.disconnect();
+    const pending = feed.querySelectorAll('img[data-src]:not(.deferred)');
+    if (typeof IntersectionObserver === 'undefined') {
+      pending.forEach(loadImage);
+      return;
+    }
+    this._mediaObserver = new IntersectionObserver((entries, observer) => {
+      for (const entry of entries) {
+        if (!entry.isIntersecting) continue;
+        observer.unobserve(entry.target);
+        loadImage(entry.target);
+      }
+    }, {
+      // With max_height the feed is its own scroller, and the lookahead
+      // margin has to apply to it rather than the viewport
+      root: this._config.max_height ? feed : null,
+      rootMargin: '300px 0px',
+    });
+    pending.forEach((img) => this._mediaObserver.observe(img));
+
+    // Opt-in autoplay attaches the stream only for videos actually on
+    // screen, and pauses them again once they scroll away
+    if (this._videoObserver) {
+      this._videoObserver.disconnect();
+      this._videoObserver = null;
+    }
+    if (!this._config.autoplay_videos || this._dataSaver) return;
+    this._videoObserver = new IntersectionObserver((entries) => {
+      for (const entry of entries) {
+        const video = entry.target.querySelector('video');
+        if (entry.isIntersecting) {
+          if (video) video.play().catch(() => {});
+          else if (!hlsFailed) this._attachVideo(entry.target, true);
+        } else if (video) {
+          video.pause();
+        }
+      }
+    }, { threshold: 0.5 });
+    feed.querySelectorAll('.post-video[data-kind="video"]').forEach((el) => this._videoObserver.observe(el));
+  }
+
+  async _attachVideo(container, muted) {
+    // Swap the poster for a <video> and hand it the HLS playlist; until
+    // this runs, a video post costs one thumbnail and nothing else
+    if (container.dataset.attached) return;
+    container.dataset.attached = 'true';
+    const poster = container.querySelector('.video-poster');
+    const video = document.createElement('video');
+    video.controls = true;
+    video.playsInline = true;
+    video.muted = muted;
+    video.preload = 'none';
+    video.poster = poster.currentSrc || poster.dataset.src || '';
+    if (poster.alt) video.setAttribute('aria-label', poster.alt);
+
+    const playlist = container.dataset.playlist;
+    try {
+      if (video.canPlayType('application/vnd.apple.mpegurl')) {
+        video.src = playlist;
+      } else {
+        const Hls = await loadHls();
+        if (!Hls.isSupported()) throw new Error('HLS playback is not supported');
+        const hls = new Hls();
+        hls.loadSource(playlist);
+        hls.attachMedia(video);
+        this._hlsPlayers.set(video, hls);
+      }
+    } catch (err) {
+      console.warn('Bluesky Feed Card: could not play video', err);
+      delete container.dataset.attached;
+      // Without a player, the post on bsky.app is the next best thing
+      const url = container.closest('.post')?.dataset.postUrl;
+      if (!muted && url && url !== '#') window.open(url, '_blank', 'noopener');
+      return;
+    }
+    if (!container.isConnected) {
+      const hls = this._hlsPlayers.get(video);
+      if (hls) {
+        hls.destroy();
+        this._hlsPlayers.delete(video);
+      }
+      return;
+    }
+    container.replaceChildren(video);
+    video.play().catch(() => {});
+  }
+
+  _destroyVideos(containers = null) {
+    // Tear down the hls.js players inside the given containers, or all
+    for (const [video, hls] of this._hlsPlayers) {
+      if (containers && !containers.some((el) => el.contains(video))) continue;
+      hls.destroy();
+      this._hlsPlayers.delete(video);
+    }
   }
 
   _renderPost(post) {
     const url = postUrl(post.author_handle, post.uri);
     const rawName = post.author_name || post.author_handle || '';
-    const avatar = post.author_avatar || defaultAvatar(rawName);
+    const avatar = (!this._dataSaver && post.author_avatar) || defaultAvatar(rawName);
     const name = escapeHtml(rawName);
     const handle = escapeHtml(post.author_handle ? `@${post.author_handle}` : '');
     const time = timeAgo(post.created_at);
@@ -801,14 +1117,35 @@ class BlueskyFeedCard extends HTMLElement {
     let imagesHtml = '';
     if (this._config.show_images && post.images && post.images.length > 0) {
       const count = Math.min(post.images.length, 4);
+      const deferred = this._dataSaver ? ' deferred' : '';
       imagesHtml = `
         <div class="post-images count-${count}">
           ${post.images.slice(0, 4).map((img) =>
-            `<img class="post-image" src="${escapeHtml(img.thumb || img.fullsize)}"
+            `<img class="post-image${deferred}" data-src="${escapeHtml(img.thumb || img.fullsize)}"
                   alt="${escapeHtml(img.alt || '')}"
                   data-fullsize="${escapeHtml(img.fullsize || img.thumb)}"
-                  loading="lazy" />`
+                  ${count === 1 ? aspectStyle(img) : ''}
+                  loading="lazy" decoding="async" />`
           ).join('')}
+          ${this._dataSaver ? `<button class="media-load" type="button">Show ${count === 1 ? 'image' : `${count} images`}</button>` : ''}
+        </div>
+      `;
+    }
+
+    let videoHtml = '';
+    const video = post.video;
+    if (this._config.show_images && video && video.playlist) {
+      const deferred = this._dataSaver ? ' deferred' : '';
+      const poster = video.thumbnail || (video.type === 'gif' ? video.playlist : '');
+      videoHtml = `
+        <div class="post-video" data-kind="${video.type === 'gif' ? 'gif' : 'video'}"
+             data-playlist="${escapeHtml(video.playlist)}"${aspectStyle(video)}>
+          <img class="video-poster${deferred}" data-src="${escapeHtml(poster)}"
+               ${video.type === 'gif' ? `data-gif="${escapeHtml(video.playlist)}"` : ''}
+               alt="${escapeHtml(video.alt || '')}" loading="lazy" decoding="async" />
+          ${video.type === 'gif'
+            ? (this._dataSaver ? '<button class="media-load" type="button">Show GIF</button>' : '')
+            : `<button class="video-play" type="button" aria-label="Play video">${ICON_PLAY}</button>`}
         </div>
       `;
     }
@@ -822,7 +1159,7 @@ class BlueskyFeedCard extends HTMLElement {
       if (safeExtUri) externalHtml = `
         <a class="external-card" href="${escapeHtml(safeExtUri)}" target="_blank"
            rel="noopener">
-          ${ext.thumb ? `<img class="external-thumb" src="${escapeHtml(ext.thumb)}" loading="lazy" />` : ''}
+          ${ext.thumb && !this._dataSaver ? `<img class="external-thumb" data-src="${escapeHtml(ext.thumb)}" loading="lazy" decoding="async" />` : ''}
           <div class="external-info">
             <div class="external-domain">${escapeHtml(domain)}</div>
             ${ext.title ? `<div class="external-title">${escapeHtml(ext.title)}</div>` : ''}
@@ -835,11 +1172,11 @@ class BlueskyFeedCard extends HTMLElement {
     let quoteHtml = '';
     if (post.quote && post.quote.text) {
       const q = post.quote;
-      const qAvatar = q.author_avatar || defaultAvatar(q.author_name || q.author_handle);
+      const qAvatar = (!this._dataSaver && q.author_avatar) || defaultAvatar(q.author_name || q.author_handle);
       quoteHtml = `
         <div class="quote-post">
           <div class="quote-header">
-            <img class="quote-avatar" src="${escapeHtml(qAvatar)}"
+            <img class="quote-avatar" data-src="${escapeHtml(qAvatar)}" decoding="async"
                  onerror="this.src='${defaultAvatar(q.author_name || q.author_handle)}'" />
             <span class="quote-name">${escapeHtml(q.author_name || q.author_handle || '')}</span>
             <span class="quote-handle">@${escapeHtml(q.author_handle || '')}</span>
@@ -871,17 +1208,18 @@ class BlueskyFeedCard extends HTMLElement {
         ${repostHtml}
         ${replyHtml}
         <div class="post" data-post-url="${escapeHtml(url)}" data-post-uri="${escapeHtml(post.uri || '')}" data-post-cid="${escapeHtml(post.cid || '')}">
-          <img class="avatar" src="${escapeHtml(avatar)}" loading="lazy"
+          <img class="avatar" data-src="${escapeHtml(avatar)}" loading="lazy" decoding="async"
                onerror="this.src='${defaultAvatar(rawName)}'" />
           <div class="post-content">
             <div class="post-header">
               <span class="display-name">${name}</span>
               <span class="handle">${handle}</span>
               <span class="separator">&middot;</span>
-              <span class="timestamp">${time}</span>
+              <span class="timestamp" data-created-at="${escapeHtml(post.created_at || '')}">${time}</span>
             </div>
             ${richText ? `<div class="post-text">${richText}</div>` : ''}
             ${imagesHtml}
+            ${videoHtml}
             ${externalHtml}
             ${quoteHtml}
             ${metricsHtml}
@@ -895,7 +1233,7 @@ class BlueskyFeedCard extends HTMLElement {
     // Post click opens post on bsky.app (skip if clicking a link, image, metric, or button)
     feed.querySelectorAll('.post').forEach((post) => {
       post.addEventListener('click', (e) => {
-        const target = e.target.closest('a, .post-image, .external-card, .metric[data-action]');
+        const target = e.target.closest('a, .post-image, .post-video, .media-load, .external-card, .metric[data-action]');
         if (target) return;
         const url = post.dataset.postUrl;
         if (url && url !== '#') {
@@ -908,7 +1246,7 @@ class BlueskyFeedCard extends HTMLElement {
       });
     });
 
-    // Image click opens lightbox
+    // Image click opens lightbox, which is the only place fullsize loads
     feed.querySelectorAll('.post-image').forEach((img) => {
       img.addEventListener('click', (e) => {
         e.preventDefault();
@@ -917,6 +1255,35 @@ class BlueskyFeedCard extends HTMLElement {
       });
     });
 
+    // Data-saver placeholder loads that post's thumbnails on tap
+    feed.querySelectorAll('.media-load').forEach((button) => {
+      button.addEventListener('click', (e) => {
+        e.preventDefault();
+        e.stopPropagation();
+        button.parentElement.querySelectorAll('img[data-src]').forEach(loadImage);
+        button.remove();
+      });
+    });
+
+    // GIFs show their still thumbnail first and swap to the animation
+    // once it has painted
+    feed.querySelectorAll('.video-poster[data-gif]').forEach((img) => {
+      const animate = () => {
+        if (img.dataset.gif && img.src !== img.dataset.gif) img.src = img.dataset.gif;
+      };
+      img.addEventListener('load', animate, { once: true });
+    });
+
+    // Videos attach their stream only when play is pressed
+    feed.querySelectorAll('.video-play').forEach((button) => {
+      button.addEventListener('click', (e) => {
+        e.preventDefault();
+        e.stopPropagation();
+        const container = button.closest('.post-video');
+        if (container) this._attachVideo(container, false);
+      });
+    });
+
     // Like button clicks
     feed.querySelectorAll('.metric[data-action="like"]').forEach((metricEl) => {
       metricEl.addEventListener('click', (e) => {
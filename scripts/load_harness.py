@@ -0,0 +1,507 @@
+"""Soak/load harness for BlueskyFeedCoordinator.
+
+Starts N coordinators inside a bare HomeAssistant core (no config, no
+integrations loaded) and points them at a local fake XRPC server, then
+refreshes them continuously and reports throughput, refresh latency,
+event-loop lag, RSS and connection churn over time.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/load_harness.py --feeds 50 --interval 5 --duration 120 \\
+        --latency 0.15 --jitter 0.1 --error-rate 0.02 --page-size 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.bluesky_feed import coordinator as coordinator_module  # noqa: E402
+from custom_components.bluesky_feed.const import (  # noqa: E402
+    CONF_AUTHOR_HANDLE,
+    CONF_FEED_TYPE,
+    CONF_FEED_URI,
+    CONF_HANDLE,
+    CONF_PASSWORD,
+    CONF_POST_LIMIT,
+    CONF_UPDATE_INTERVAL,
+    FEED_TYPE_AUTHOR,
+    FEED_TYPE_CUSTOM,
+    FEED_TYPE_TIMELINE,
+)
+from custom_components.bluesky_feed.coordinator import (  # noqa: E402
+    BlueskyFeedCoordinator,
+)
+
+FEED_TYPES = [FEED_TYPE_TIMELINE, FEED_TYPE_AUTHOR, FEED_TYPE_CUSTOM]
+
+
+# ---------------------------------------------------------------------------
+# Fake XRPC server
+# ---------------------------------------------------------------------------
+
+
+class FakeXrpcServer:
+    """Minimal stand-in for the Bluesky PDS and public AppView."""
+
+    def __init__(
+        self,
+        latency: float,
+        jitter: float,
+        error_rate: float,
+        page_size: int,
+        token_ttl: float,
+    ) -> None:
+        """Initialize the server."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.token_ttl = token_ttl
+        self.requests = 0
+        self.errors = 0
+        self.logins = 0
+        self.connections: set[tuple[str, int]] = set()
+        self._tokens: dict[str, float] = {}
+        self._seq = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        app = web.Application()
+        app.router.add_post(
+            "/xrpc/com.atproto.server.createSession", self._create_session
+        )
+        app.router.add_post(
+            "/xrpc/com.atproto.server.refreshSession", self._refresh_session
+        )
+        for nsid in (
+            "app.bsky.feed.getTimeline",
+            "app.bsky.feed.getAuthorFeed",
+            "app.bsky.feed.getFeed",
+        ):
+            app.router.add_get(f"/xrpc/{nsid}", self._feed)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _simulate(self, request: web.Request) -> web.Response | None:
+        """Apply latency and random failures to a request."""
+        self.requests += 1
+        transport = request.transport
+        peer = transport.get_extra_info("peername") if transport else None
+        if peer:
+            self.connections.add(peer[:2])
+        await asyncio.sleep(
+            max(0.0, random.gauss(self.latency, self.jitter))
+        )
+        if random.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response(
+                {"error": "InternalServerError"}, status=500
+            )
+        return None
+
+    def _issue_tokens(self) -> dict[str, str]:
+        """Create a fresh access/refresh token pair."""
+        self._seq += 1
+        access = f"access-{self._seq}"
+        self._tokens[access] = time.monotonic() + self.token_ttl
+        return {"accessJwt": access, "refreshJwt": f"refresh-{self._seq}"}
+
+    async def _create_session(self, request: web.Request) -> web.Response:
+        if (failed := await self._simulate(request)) is not None:
+            return failed
+        self.logins += 1
+        body = await request.json()
+        return web.json_response(
+            {**self._issue_tokens(), "did": f"did:plc:{body['identifier']}"}
+        )
+
+    async def _refresh_session(self, request: web.Request) -> web.Response:
+        if (failed := await self._simulate(request)) is not None:
+            return failed
+        return web.json_response(self._issue_tokens())
+
+    async def _feed(self, request: web.Request) -> web.Response:
+        if (failed := await self._simulate(request)) is not None:
+            return failed
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        expires = self._tokens.get(token)
+        if token and (expires is None or expires < time.monotonic()):
+            return web.json_response(
+                {"error": "ExpiredToken", "message": "Token has expired"},
+                status=400,
+            )
+        limit = min(int(request.query.get("limit", 20)), self.page_size)
+        return web.json_response({"feed": [_fake_item(i) for i in range(limit)]})
+
+
+def _fake_item(i: int) -> dict[str, Any]:
+    """Build a feed item shaped like the real AppView response."""
+    now = time.time()
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(now - i * 60))
+    return {
+        "post": {
+            "uri": f"at://did:plc:author{i % 17}/app.bsky.feed.post/{int(now) - i}",
+            "cid": f"bafyrei{i:08d}",
+            "author": {
+                "did": f"did:plc:author{i % 17}",
+                "handle": f"author{i % 17}.bsky.social",
+                "displayName": f"Author {i % 17}",
+                "avatar": "https://cdn.bsky.app/img/avatar/plain/x/y@jpeg",
+            },
+            "record": {
+                "$type": "app.bsky.feed.post",
+                "text": f"Post number {i} " + "lorem ipsum dolor " * 8,
+                "createdAt": stamp,
+                "langs": ["en"],
+            },
+            "embed": {
+                "$type": "app.bsky.embed.images#view",
+                "images": [
+                    {
+                        "thumb": f"https://cdn.bsky.app/img/feed_thumbnail/{i}",
+                        "fullsize": f"https://cdn.bsky.app/img/feed_fullsize/{i}",
+                        "alt": "",
+                    }
+                ],
+            }
+            if i % 3 == 0
+            else None,
+            "likeCount": random.randint(0, 500),
+            "repostCount": random.randint(0, 100),
+            "replyCount": random.randint(0, 50),
+            "indexedAt": stamp,
+            "viewer": {},
+        }
+    }
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _rss_mb() -> float:
+    """Return the current resident set size in MiB."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # Peak RSS is the best portable fallback (KiB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Stats:
+    """Rolling counters collected while the harness runs."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.latencies: list[float] = []
+        self.window_latencies: list[float] = []
+        self.loop_lag: list[float] = []
+        self.window_loop_lag: list[float] = []
+        self.refreshes = 0
+        self.failures = 0
+        self.window_failures = 0
+        self.last_error: BaseException | None = None
+        self.samples: list[dict[str, Any]] = []
+
+    def record_refresh(self, elapsed: float, success: bool) -> None:
+        """Record one coordinator refresh."""
+        self.refreshes += 1
+        if not success:
+            self.failures += 1
+            self.window_failures += 1
+        self.latencies.append(elapsed)
+        self.window_latencies.append(elapsed)
+
+    def record_lag(self, lag: float) -> None:
+        """Record one event-loop lag sample."""
+        self.loop_lag.append(lag)
+        self.window_loop_lag.append(lag)
+
+
+async def _measure_loop_lag(stats: Stats, period: float) -> None:
+    """Sample how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + period
+        await asyncio.sleep(period)
+        stats.record_lag(max(0.0, loop.time() - expected))
+
+
+async def _drive(
+    coordinator: BlueskyFeedCoordinator,
+    interval: float,
+    stats: Stats,
+) -> None:
+    """Refresh one coordinator on its interval, with a random phase."""
+    await asyncio.sleep(random.uniform(0, interval))
+    while True:
+        started = time.perf_counter()
+        await coordinator.async_refresh()
+        stats.record_refresh(
+            time.perf_counter() - started, coordinator.last_update_success
+        )
+        if not coordinator.last_update_success:
+            stats.last_error = coordinator.last_exception
+        await asyncio.sleep(interval)
+
+
+async def _report(
+    stats: Stats,
+    server: FakeXrpcServer,
+    period: float,
+    started: float,
+    baseline_rss: float,
+    feeds: int,
+) -> None:
+    """Print a line of rolling statistics every period."""
+    last_refreshes = 0
+    while True:
+        await asyncio.sleep(period)
+        rss = _rss_mb()
+        sample = {
+            "t": round(time.monotonic() - started, 1),
+            "refresh_per_s": round((stats.refreshes - last_refreshes) / period, 2),
+            "p50_ms": round(_percentile(stats.window_latencies, 50) * 1000, 1),
+            "p99_ms": round(_percentile(stats.window_latencies, 99) * 1000, 1),
+            "loop_lag_p99_ms": round(
+                _percentile(stats.window_loop_lag, 99) * 1000, 2
+            ),
+            "loop_lag_max_ms": round(max(stats.window_loop_lag, default=0) * 1000, 2),
+            "rss_mb": round(rss, 1),
+            "rss_per_feed_kb": round((rss - baseline_rss) * 1024 / feeds, 1),
+            "connections": len(server.connections),
+            "requests": server.requests,
+        }
+        window_refreshes = stats.refreshes - last_refreshes
+        all_failed = window_refreshes and stats.window_failures == window_refreshes
+        stats.samples.append(sample)
+        last_refreshes = stats.refreshes
+        stats.window_failures = 0
+        stats.window_latencies.clear()
+        stats.window_loop_lag.clear()
+        if all_failed:
+            print(
+                f"every refresh in this window failed: {stats.last_error!r}",
+                file=sys.stderr,
+                flush=True,
+            )
+        print(
+            "t={t:>6}s  {refresh_per_s:>7}/s  p50={p50_ms}ms  p99={p99_ms}ms  "
+            "lag p99={loop_lag_p99_ms}ms max={loop_lag_max_ms}ms  "
+            "rss={rss_mb}MiB ({rss_per_feed_kb}KiB/feed)  "
+            "conns={connections}/{requests} req".format(**sample),
+            flush=True,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def _make_entry(i: int, args: argparse.Namespace) -> SimpleNamespace:
+    """Build a stand-in config entry for feed number i."""
+    feed_type = FEED_TYPES[i % len(FEED_TYPES)] if args.mixed else FEED_TYPE_TIMELINE
+    return SimpleNamespace(
+        entry_id=f"load{i:05d}",
+        title=f"Load feed {i}",
+        data={
+            CONF_HANDLE: f"user{i % args.accounts}.test",
+            CONF_PASSWORD: "app-password",
+            CONF_FEED_TYPE: feed_type,
+            CONF_AUTHOR_HANDLE: f"author{i}.test",
+            CONF_FEED_URI: f"at://did:plc:gen/app.bsky.feed.generator/feed{i}",
+            CONF_POST_LIMIT: args.post_limit,
+            CONF_UPDATE_INTERVAL: max(30, int(args.interval)),
+        },
+        options={},
+    )
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the harness and return the summary."""
+    server = FakeXrpcServer(
+        args.latency, args.jitter, args.error_rate, args.page_size, args.token_ttl
+    )
+    await server.start()
+    coordinator_module.PDSHOST = server.url
+    coordinator_module.PUBLIC_API_HOST = server.url
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        stats = Stats()
+        baseline_rss = _rss_mb()
+
+        coordinators = []
+        for i in range(args.feeds):
+            entry = _make_entry(i, args)
+            coordinator = BlueskyFeedCoordinator(hass, entry)
+            # There is no config entry context to pick this up from
+            coordinator.config_entry = entry
+            coordinators.append(coordinator)
+        started = time.monotonic()
+        tasks = [
+            asyncio.create_task(_measure_loop_lag(stats, args.lag_period)),
+            asyncio.create_task(
+                _report(stats, server, args.report, started, baseline_rss, args.feeds)
+            ),
+            *(
+                asyncio.create_task(_drive(coord, args.interval, stats))
+                for coord in coordinators
+            ),
+        ]
+
+        try:
+            await asyncio.sleep(args.duration)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await hass.async_stop(force=True)
+            await server.stop()
+
+    elapsed = time.monotonic() - started
+    return {
+        "feeds": args.feeds,
+        "duration_s": round(elapsed, 1),
+        "refreshes": stats.refreshes,
+        "failures": stats.failures,
+        "last_error": repr(stats.last_error) if stats.last_error else None,
+        "throughput_per_s": round(stats.refreshes / elapsed, 2),
+        "refresh_p50_ms": round(_percentile(stats.latencies, 50) * 1000, 1),
+        "refresh_p99_ms": round(_percentile(stats.latencies, 99) * 1000, 1),
+        "refresh_mean_ms": round(
+            statistics.fmean(stats.latencies) * 1000 if stats.latencies else 0, 1
+        ),
+        "loop_lag_p99_ms": round(_percentile(stats.loop_lag, 99) * 1000, 2),
+        "loop_lag_max_ms": round(max(stats.loop_lag, default=0) * 1000, 2),
+        "rss_start_mb": round(baseline_rss, 1),
+        "rss_end_mb": round(_rss_mb(), 1),
+        "server_requests": server.requests,
+        "server_errors": server.errors,
+        "server_logins": server.logins,
+        "server_connections": len(server.connections),
+        "samples": stats.samples,
+    }
+
+
+def main() -> None:
+    """Parse arguments and run the harness."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--feeds", type=int, default=20,
+        help="coordinators to run",
+    )
+    parser.add_argument(
+        "--accounts", type=int, default=5,
+        help="distinct handles",
+    )
+    parser.add_argument(
+        "--mixed", action="store_true",
+        help="mix timeline, author and custom feeds",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=5.0,
+        help="seconds between refreshes per feed",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60.0,
+        help="seconds to run",
+    )
+    parser.add_argument(
+        "--report", type=float, default=5.0,
+        help="seconds between report lines",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.1,
+        help="mean server latency (s)",
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.05,
+        help="latency std deviation (s)",
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0,
+        help="fraction of requests that fail with 500",
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=50,
+        help="max posts per page",
+    )
+    parser.add_argument(
+        "--post-limit", type=int, default=20,
+        help="post_limit per feed",
+    )
+    parser.add_argument(
+        "--token-ttl", type=float, default=300.0,
+        help="access token lifetime (s)",
+    )
+    parser.add_argument(
+        "--lag-period", type=float, default=0.05,
+        help="loop lag sampling period (s)",
+    )
+    parser.add_argument("--json", type=Path, help="write the summary as JSON to this file")
+    parser.add_argument("--seed", type=int, help="random seed")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    logging.basicConfig(level=logging.WARNING)
+
+    summary = asyncio.run(_run(args))
+    printable = {k: v for k, v in summary.items() if k != "samples"}
+    print(json.dumps(printable, indent=2))
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+    # Latency numbers from a run where nothing succeeded are meaningless
+    if summary["refreshes"] == 0 or summary["failures"] == summary["refreshes"]:
+        sys.exit(
+            f"harness run invalid: {summary['failures']}/{summary['refreshes']} "
+            f"refreshes failed (last error: {summary['last_error']})"
+        )
+
+
+if __name__ == "__main__":
+    main()